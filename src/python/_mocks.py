@@ -0,0 +1,38 @@
+"""
+Mock featuretools definitions used for type generation when featuretools isn't installed
+"""
+
+class EntitySetMock:
+    def __init__(self, id, entities=None, relationships=None):
+        pass
+        
+class EntityMock:
+    def __init__(self, id, df, index, time_index=None, variable_types=None):
+        pass
+        
+class RelationshipMock:
+    def __init__(self, parent_entity, parent_variable, child_entity, child_variable):
+        pass
+
+# Create mock module structure        
+class FTMock:
+    EntitySet = EntitySetMock
+    Entity = EntityMock
+    Relationship = RelationshipMock
+    
+    def dfs(self, entityset, target_entity, **kwargs):
+        pass
+        
+    def calculate_feature_matrix(self, features, entityset, **kwargs):
+        pass
+        
+    class primitives:
+        class AggregationPrimitive:
+            pass
+            
+        class TransformPrimitive:
+            pass
+
+def make_mock_ft():
+    """Create a mock standing in for the featuretools module"""
+    return FTMock()
@@ -1,66 +1,825 @@
 #!/usr/bin/env python
 import sys
+import os
 import json
+import struct
+import hashlib
+import weakref
+from collections import OrderedDict
+from functools import partial
+from multiprocessing import get_all_start_methods, get_context, resource_tracker, shared_memory
 import featuretools as ft
 import pandas as pd
 import numpy as np
 from io import StringIO
 
-# Setup JSON serialization/deserialization for numpy/pandas objects
-class NumpyEncoder(json.JSONEncoder):
-    def default(self, obj):
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
+# orjson is optional - it's considerably faster than the stdlib codec and
+# serializes numpy arrays natively
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# pybase64 is optional - it's a SIMD-accelerated drop-in for the stdlib base64
+try:
+    import pybase64 as base64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    import base64
+    PYBASE64_AVAILABLE = False
+
+# With FT_BRIDGE_NDARRAY=base64, numeric DataFrame/Series values larger than
+# BASE64_MIN_SIZE are sent as {'type': 'ndarray', 'dtype', 'shape', 'b64'} raw
+# little-endian bytes rather than JSON number lists. Smaller arrays stay lists,
+# where the framing would outweigh the savings
+BASE64_ARRAYS = os.environ.get('FT_BRIDGE_NDARRAY', 'list') == 'base64'
+BASE64_MIN_SIZE = 64
+
+def _ndarray_encode(obj):
+    """Encode a numeric array as base64 when enabled, passing others through"""
+    if BASE64_ARRAYS and obj.size > BASE64_MIN_SIZE and obj.dtype.kind in 'biuf':
+        obj = np.ascontiguousarray(obj, dtype=obj.dtype.newbyteorder('<'))
+        return {
+            'type': 'ndarray',
+            'dtype': obj.dtype.str,
+            'shape': obj.shape,
+            'b64': base64.b64encode(obj.tobytes()).decode('ascii')
+        }
+    return obj
+
+def _ndarray_decode(value):
+    """Decode a {'type': 'ndarray'} value, passing plain lists through"""
+    if isinstance(value, dict) and value.get('type') == 'ndarray':
+        return np.frombuffer(base64.b64decode(value['b64']), dtype=value['dtype']).reshape(value['shape'])
+    return value
+
+# Setup JSON serialization for numpy/pandas objects
+def _dataframe_encode(obj):
+    """Columnar layout - one array per column rather than one dict per row"""
+    return {
+        'type': 'dataframe',
+        'orient': 'list',
+        'columns': list(obj.columns),
+        'data': {column: _ndarray_encode(obj[column].to_numpy()) for column in obj.columns}
+    }
+
+def _series_encode(obj):
+    """
+    Values go out as one array; the index is only sent when it isn't the
+    default 0..n-1 range
+    """
+    index = obj.index
+    if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+        return {'type': 'series', 'data': _ndarray_encode(obj.to_numpy()), 'name': obj.name}
+    return {
+        'type': 'series',
+        'index': _ndarray_encode(index.to_numpy()),
+        'data': _ndarray_encode(obj.to_numpy()),
+        'name': obj.name
+    }
+
+# Encoders keyed by exact type, so default() is one dict lookup rather than an
+# isinstance chain. Numpy scalars only reach default() with the stdlib codec
+_ENCODERS = {
+    np.ndarray: lambda obj: obj.tolist(),
+    pd.DataFrame: _dataframe_encode,
+    pd.Series: _series_encode,
+    np.generic: lambda obj: obj.item(),
+}
+
+def _default(obj):
+    """Serialize objects the JSON codec doesn't handle natively"""
+    encode = _ENCODERS.get(type(obj))
+    if encode is None:
+        # Subclasses resolve through their MRO once, then hit the table directly
+        for base in type(obj).__mro__[1:]:
+            encode = _ENCODERS.get(base)
+            if encode is not None:
+                _ENCODERS[type(obj)] = encode
+                break
+        else:
+            raise TypeError(f'Object of type {type(obj).__name__} is not JSON serializable')
+    return encode(obj)
+
+if ORJSON_AVAILABLE:
+    _DUMPS_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj, default=_default):
+        return orjson.dumps(obj, default=default, option=_DUMPS_OPTIONS)
+
+    _loads = orjson.loads
+else:
+    def _dumps(obj, default=_default):
+        return json.dumps(obj, default=default).encode('utf-8')
+
+    _loads = json.loads
+
+# pysimdjson is optional - its SIMD parser outpaces both codecs above on large,
+# number-heavy requests such as embedded DataFrames
+try:
+    import simdjson
+    _parser = simdjson.Parser()
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+# Responses to malformed requests are built once, so a flood of bad input
+# doesn't allocate a fresh error payload per line
+_ERR_BAD_JSON = _dumps({'error': 'Request is not valid JSON'})
+_ERR_BAD_REQUEST = _dumps({'error': "Request must be an object with 'function' and 'params'"})
+
+class RequestError(Exception):
+    """A malformed request, answered with a prebuilt error response"""
+    def __init__(self, response):
+        super().__init__(response)
+        self.response = response
+
+def _parse_request_simdjson(request):
+    """Parse a request into its function name and params with pysimdjson"""
+    if isinstance(request, str):
+        request = request.encode('utf-8')
+    try:
+        doc = _parser.parse(request)
+    except ValueError:
+        raise RequestError(_ERR_BAD_JSON) from None
+
+    try:
+        # Only the fields we use are converted to Python objects. The proxies
+        # must not outlive this call since the parser is reused per request
+        function = doc['function']
+        if isinstance(function, str):
+            return function, doc['params'].as_dict()
+    except (KeyError, TypeError, AttributeError):
+        pass
+    raise RequestError(_ERR_BAD_REQUEST)
+
+def _parse_request_json(request):
+    """Parse a request into its function name and params with orjson/json"""
+    try:
+        doc = _loads(request)
+    except ValueError:
+        raise RequestError(_ERR_BAD_JSON) from None
+
+    try:
+        if isinstance(doc['function'], str) and isinstance(doc['params'], dict):
+            return doc['function'], doc['params']
+    except (KeyError, TypeError):
+        pass
+    raise RequestError(_ERR_BAD_REQUEST)
+
+# Pick the parser once rather than checking for pysimdjson on every request
+_parse_request = _parse_request_simdjson if SIMDJSON_AVAILABLE else _parse_request_json
+
+# pyarrow is optional - it's only needed for the Arrow transport, which moves
+# DataFrames as columnar Arrow IPC streams instead of row-wise JSON records
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Wire format used on stdin/stdout: 'lines' (newline-delimited JSON), 'framed'
+# (uint32 length-prefixed JSON, with result DataFrames streamed per column - see
+# stream_request) or 'arrow' (framed JSON plus Arrow IPC tables)
+TRANSPORT = os.environ.get('FT_BRIDGE_TRANSPORT', 'lines')
+
+_UINT32 = struct.Struct('>I')
+
+def _read_frame(stream):
+    """Read a uint32 length-prefixed frame, returning None at end of stream"""
+    header = stream.read(_UINT32.size)
+    if len(header) < _UINT32.size:
+        return None
+    return stream.read(_UINT32.unpack(header)[0])
+
+def _write_frame(stream, payload):
+    """Write a uint32 length-prefixed frame"""
+    stream.write(_UINT32.pack(len(payload)))
+    stream.write(payload)
+
+def _read_arrow_message(stream):
+    """
+    Read an Arrow transport message:
+    [uint32 json_len][json][uint32 n_tables] then n_tables x [uint32 arrow_len][arrow]
+    """
+    request = _read_frame(stream)
+    if request is None:
+        return None, None
+    # A stream ending partway through the message is treated as end of stream
+    header = stream.read(_UINT32.size)
+    if len(header) < _UINT32.size:
+        return None, None
+    tables = []
+    for _ in range(_UINT32.unpack(header)[0]):
+        table = _read_frame(stream)
+        if table is None:
+            return None, None
+        tables.append(table)
+    return request, tables
+
+def _write_arrow_message(stream, response, tables):
+    """Write an Arrow transport message (see _read_arrow_message)"""
+    _write_frame(stream, response)
+    stream.write(_UINT32.pack(len(tables)))
+    for table in tables:
+        _write_frame(stream, table)
+
+def _dataframe_from_arrow(payload):
+    """Load a DataFrame from Arrow IPC stream bytes"""
+    # split_blocks avoids consolidating columns, so numeric data isn't copied
+    return pa.ipc.open_stream(payload).read_all().to_pandas(split_blocks=True)
+
+def _dataframe_to_arrow(df):
+    """Serialize a DataFrame as Arrow IPC stream bytes"""
+    table = pa.Table.from_pandas(df)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+def _attach_shared_memory(name):
+    """Attach to a shared memory block owned by the parent process"""
+    shm = shared_memory.SharedMemory(name=name)
+    # Attaching registers the block with this process's resource tracker,
+    # which would unlink it on exit - the parent owns its lifetime
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+def _dataframe_from_shm(value):
+    """Load a DataFrame from an Arrow IPC stream in shared memory"""
+    shm = _attach_shared_memory(value['name'])
+    try:
+        size = value.get('size', shm.size)
+        table = pa.ipc.open_stream(pa.py_buffer(shm.buf[:size])).read_all()
+        # Arrow buffers must be released before the block can be closed, so
+        # the DataFrame gets its own copy of the data
+        df = table.to_pandas()
+        del table
+    finally:
+        shm.close()
+    return df
+
+def _dataframe_to_shm(df):
+    """Write a DataFrame to a new shared memory block owned by the parent"""
+    payload = _dataframe_to_arrow(df)
+    shm = shared_memory.SharedMemory(create=True, size=max(payload.size, 1))
+    try:
+        shm.buf[:payload.size] = memoryview(payload).cast('B')
+    except BaseException:
+        # The block never reaches the caller, so it's removed here
+        shm.close()
+        shm.unlink()
+        raise
+    resource_tracker.unregister(shm._name, 'shared_memory')
+    shm.close()
+    return {'type': 'shm', 'name': shm.name, 'size': payload.size}
+
+def _arrow_default(result_tables):
+    """Build a default() hook that moves DataFrames into result_tables"""
+    def default(obj):
         if isinstance(obj, pd.DataFrame):
-            return {
-                'type': 'dataframe',
-                'data': obj.to_dict(orient='records')
-            }
-        if isinstance(obj, pd.Series):
-            return {
-                'type': 'series',
-                'data': obj.to_dict()
-            }
-        return json.JSONEncoder.default(self, obj)
+            result_tables.append(_dataframe_to_arrow(obj))
+            return {'type': 'arrow', 'ref': len(result_tables) - 1}
+        return _default(obj)
+    return default
+
+# xxhash is optional - it's a much faster way to fingerprint request payloads
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Results of pure functions, keyed by a fingerprint of the request payload, so
+# resending the same tables skips DataFrame construction and DFS entirely.
+# FT_CACHE_SIZE caps the number of cached results (0 disables the cache) and
+# FT_CACHE_BYTES their total DataFrame memory, so a long-lived bridge doesn't
+# hold on to many large feature matrices. Results larger than FT_CACHE_BYTES
+# aren't cached
+CACHEABLE_FUNCTIONS = {'ft_dfs', 'ft_dfs_cached', 'ft_dfs_batch', 'ft_create_entityset'}
+RESULT_CACHE_SIZE = int(os.environ.get('FT_CACHE_SIZE', '64'))
+RESULT_CACHE_BYTES = int(os.environ.get('FT_CACHE_BYTES', str(256 * 1024 * 1024)))
+# {key: (result, size in bytes)}, least recently used first
+RESULT_CACHE = OrderedDict()
+_result_cache_bytes = 0
+
+def _fingerprint(request, tables, shm_params=()):
+    """
+    Hash a request, its Arrow tables and the contents of the shared memory
+    blocks in shm_params, which the request only refers to by name
+    """
+    if isinstance(request, str):
+        request = request.encode('utf-8')
+    digest = xxhash.xxh3_64() if XXHASH_AVAILABLE else hashlib.blake2b(digest_size=8)
+    digest.update(request)
+    for table in tables:
+        digest.update(table)
+    for value in shm_params:
+        shm = _attach_shared_memory(value['name'])
+        try:
+            data = shm.buf[:value.get('size', shm.size)]
+            try:
+                digest.update(data)
+            finally:
+                data.release()
+        finally:
+            shm.close()
+    return digest.digest()
+
+def _data_params(value):
+    """Yield the DataFrame/Series params nested in a JSON-like value"""
+    if _is_data_param(value):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _data_params(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _data_params(item)
+
+def _shm_params(value):
+    """Yield the shared memory params nested in a JSON-like value"""
+    return (param for param in _data_params(value) if param['type'] == 'shm')
+
+def _result_size(result):
+    """Approximate the memory held by the DataFrames/Series in a result"""
+    if isinstance(result, pd.DataFrame):
+        return int(result.memory_usage(deep=True).sum())
+    if isinstance(result, pd.Series):
+        return int(result.memory_usage(deep=True))
+    if isinstance(result, (list, tuple)):
+        return sum(_result_size(item) for item in result)
+    # An EntitySet holds its DataFrames
+    dataframes = getattr(result, 'dataframes', None)
+    if isinstance(dataframes, list):
+        return _result_size(dataframes)
+    return 0
+
+def _cache_result(key, result):
+    """Store a result, evicting least recently used entries to stay within the limits"""
+    global _result_cache_bytes
+    size = _result_size(result)
+    if size > RESULT_CACHE_BYTES:
+        return
+    RESULT_CACHE[key] = (result, size)
+    _result_cache_bytes += size
+    while len(RESULT_CACHE) > RESULT_CACHE_SIZE or _result_cache_bytes > RESULT_CACHE_BYTES:
+        _, (_, evicted_size) = RESULT_CACHE.popitem(last=False)
+        _result_cache_bytes -= evicted_size
+
+def _dataframe_from_json(value):
+    """
+    Build a DataFrame from a JSON 'dataframe' param (records or columnar).
+
+    When the param carries 'dtypes', columns are built directly with those
+    dtypes instead of having pandas infer them value by value. Columnar data
+    may hold base64 {'type': 'ndarray'} columns.
+    """
+    data = value['data']
+    dtypes = value.get('dtypes')
+    if dtypes and isinstance(data, dict):
+        columns = value.get('columns') or list(data)
+        return pd.DataFrame(
+            {column: np.asarray(_ndarray_decode(data[column]), dtype=dtypes.get(column)) for column in columns},
+            copy=False
+        )
+    if dtypes:
+        df = pd.DataFrame.from_records(data, columns=value.get('columns'))
+        return df.astype(dtypes, copy=False)
+    if value.get('orient') == 'list':
+        data = {column: _ndarray_decode(values) for column, values in data.items()}
+        return pd.DataFrame(data, columns=value.get('columns'))
+    return pd.DataFrame(data)
+
+def _series_from_json(value):
+    """Build a Series from a JSON 'series' param"""
+    return pd.Series(
+        _ndarray_decode(value['data']),
+        index=_ndarray_decode(value.get('index')),
+        name=value.get('name')
+    )
+
+# DataFrame/Series builders keyed by a param's 'type', called with (param, tables)
+_PARAM_CONVERTERS = {
+    'dataframe': lambda value, tables: _dataframe_from_json(value),
+    'series': lambda value, tables: _series_from_json(value),
+    'arrow': lambda value, tables: _dataframe_from_arrow(tables[value['ref']]),
+    'shm': lambda value, tables: _dataframe_from_shm(value),
+    'ndarray': lambda value, tables: _ndarray_decode(value),
+}
+
+def _is_data_param(value):
+    """Check whether a value is a DataFrame/Series param, a dict tagged with a known 'type'"""
+    if not isinstance(value, dict):
+        return False
+    # Other dicts may carry any 'type' value, including unhashable ones
+    param_type = value.get('type')
+    return isinstance(param_type, str) and param_type in _PARAM_CONVERTERS
+
+def _build_param(value, tables, built):
+    """
+    Build a DataFrame/Series param, reusing the object already built for an
+    identical payload earlier in the same request
+    """
+    if value['type'] == 'arrow':
+        key = _fingerprint(b'arrow', (tables[value['ref']],))
+    else:
+        key = _fingerprint(_dumps(value), ())
+    if key not in built:
+        built[key] = _PARAM_CONVERTERS[value['type']](value, tables)
+    return built[key]
+
+def _dataframe_from_param(value, tables=()):
+    """Build a DataFrame from a DataFrame param, passing others through"""
+    if _is_data_param(value):
+        return _PARAM_CONVERTERS[value['type']](value, tables)
+    return value
+
+def _entityset_dataframes(dataframes, tables=()):
+    """Build the DataFrames in an ft.dfs-style {name: (dataframe, index, ...)} dict"""
+    return {
+        name: (_dataframe_from_param(spec[0], tables),) + tuple(spec[1:])
+        for name, spec in dataframes.items()
+    }
+
+# EntitySets built by ft_dfs_cached, interned by a fingerprint of their tables
+# and relationships. An entry lives as long as a cached result (whose feature
+# definitions reference the EntitySet) or a caller still holds it
+_ENTITYSETS = weakref.WeakValueDictionary()
+
+def dfs_cached(dataframes, relationships=None, entityset_id='entityset', _tables=(), **kwargs):
+    """
+    Run ft.dfs, reusing the EntitySet built by an earlier call with the same
+    dataframes and relationships.
+
+    Args:
+        dataframes: Same format as ft.dfs - {name: (dataframe, index, ...)}
+        relationships: Same format as ft.dfs - [(parent, column, child, column)]
+        entityset_id: Id of the EntitySet to build
+        _tables: Arrow IPC payloads of the request, for {'type': 'arrow'} tables
+        **kwargs: Remaining ft.dfs arguments
+
+    Returns:
+        The ft.dfs result
+    """
+    # Arrow and shared memory tables are referenced by index and name, so
+    # their data is hashed too
+    arrow_tables = [
+        _tables[param['ref']] for param in _data_params(dataframes) if param['type'] == 'arrow'
+    ]
+    key = _fingerprint(
+        _dumps([entityset_id, dataframes, relationships]), arrow_tables, _shm_params(dataframes)
+    )
+    entityset = _ENTITYSETS.get(key)
+    if entityset is None:
+        relationships = [tuple(relationship) for relationship in relationships or []]
+        entityset = ft.EntitySet(entityset_id, _entityset_dataframes(dataframes, _tables), relationships)
+        _ENTITYSETS[key] = entityset
+    return ft.dfs(entityset=entityset, **kwargs)
+
+def dfs_jit(trans_primitives=None, **kwargs):
+    """
+    Run ft.dfs with numeric custom transform primitives compiled by numba.
+
+    Callables in trans_primitives annotated with only int/float or only
+    np.ndarray are wrapped in primitives running their jitted version; other
+    entries are passed to ft.dfs unchanged.
+    """
+    # Imported lazily so numba only loads for callers that use it
+    from jit_primitives import jit_trans_primitives
+    if trans_primitives is not None:
+        trans_primitives = jit_trans_primitives(trans_primitives)
+    return ft.dfs(trans_primitives=trans_primitives, **kwargs)
+
+def dfs_shm(dataframes, relationships=None, _tables=(), **kwargs):
+    """
+    Run ft.dfs on DataFrames passed through shared memory.
+
+    Tables are given as {'type': 'shm', 'name': ..., 'size': ...} params
+    holding Arrow IPC streams, and the feature matrix is returned the same way
+    in a new block. The caller owns and must unlink every block.
+
+    Returns:
+        (feature matrix block, feature names), or the feature names alone
+        with features_only
+    """
+    if not PYARROW_AVAILABLE:
+        raise RuntimeError('pyarrow is required for shared memory DataFrames')
+    relationships = [tuple(relationship) for relationship in relationships or []]
+    result = ft.dfs(dataframes=_entityset_dataframes(dataframes, _tables), relationships=relationships, **kwargs)
+    # Feature definitions aren't JSON serializable, so only their names are
+    # returned. They're taken before the block is created, so nothing can fail
+    # between creating it and handing its name to the caller
+    if isinstance(result, tuple):
+        feature_matrix, features = result
+        feature_names = [feature.get_name() for feature in features]
+        return _dataframe_to_shm(feature_matrix), feature_names
+    return [feature.get_name() for feature in result]
+
+# Worker pool for ft_dfs_batch, created on the first batch. Workers are forked
+# so they share the already-imported featuretools/pandas state copy-on-write
+_POOL = None
+
+def _get_pool():
+    """Return the batch worker pool, or None where fork isn't available"""
+    global _POOL
+    if _POOL is None and 'fork' in get_all_start_methods():
+        _POOL = get_context('fork').Pool(os.cpu_count())
+    return _POOL
+
+def _run_one(request):
+    """Run one {'function': ..., 'params': ...} item of a batch"""
+    function_name = request['function']
+    if function_name not in dispatcher:
+        raise LookupError(f'Function {function_name} not found')
+    return _call(function_name, dict(request['params']))
+
+def dfs_batch(requests):
+    """
+    Run independent requests, e.g. ft_dfs on separate EntitySets, in parallel.
+
+    Args:
+        requests: List of {'function': ..., 'params': ...} objects
+
+    Returns:
+        The results, in request order
+    """
+    pool = _get_pool()
+    if pool is None or len(requests) < 2:
+        return [_run_one(request) for request in requests]
+    return pool.map(_run_one, requests)
 
 # Function registry to map function names to actual functions
 function_registry = {
     'ft_dfs': ft.dfs,
+    'ft_dfs_cached': dfs_cached,
+    'ft_dfs_jit': dfs_jit,
+    'ft_dfs_shm': dfs_shm,
+    'ft_dfs_batch': dfs_batch,
     'ft_create_entityset': ft.EntitySet,
     # Add more functions as needed
 }
 
-def process_request(request):
+def _freeze(value):
+    """Make a JSON-like value hashable, raising TypeError if it can't be"""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    hash(value)
+    return value
+
+class Dispatcher:
+    """
+    Resolves registry functions for requests.
+
+    Arguments that rarely change across a batch of DFS calls (the primitive
+    lists and max_depth) are bound once with functools.partial, and the
+    partial is reused by later calls with the same settings so only the
+    volatile arguments are passed per call.
+    """
+    SPECIALIZED_ARGS = ('agg_primitives', 'trans_primitives', 'max_depth')
+
+    def __init__(self, registry, specialized_functions, max_partials=32):
+        self.registry = registry
+        self.specialized_functions = specialized_functions
+        self.max_partials = max_partials
+        self._partials = OrderedDict()
+
+    def __contains__(self, function_name):
+        return function_name in self.registry
+
+    def resolve(self, function_name, params):
+        """Return the callable for a request and the params left to pass it"""
+        function = self.registry[function_name]
+        if function_name not in self.specialized_functions:
+            return function, params
+
+        bound = {name: params[name] for name in self.SPECIALIZED_ARGS if name in params}
+        try:
+            key = (function_name, function, _freeze(sorted(bound.items())))
+        except TypeError:
+            return function, params
+
+        specialized = self._partials.get(key)
+        if specialized is None:
+            specialized = partial(function, **bound)
+            self._partials[key] = specialized
+            if len(self._partials) > self.max_partials:
+                self._partials.popitem(last=False)
+        else:
+            self._partials.move_to_end(key)
+        return specialized, {name: value for name, value in params.items() if name not in bound}
+
+dispatcher = Dispatcher(function_registry, {'ft_dfs', 'ft_dfs_cached', 'ft_dfs_jit', 'ft_dfs_shm'})
+
+# Functions building DataFrames nested in their params themselves, which are
+# passed the request's Arrow tables as _tables
+TABLE_FUNCTIONS = {'ft_dfs_cached', 'ft_dfs_shm'}
+
+def _execute(request, tables=()):
+    """Parse a request, run its function and return the result"""
+    # Parse request
+    function_name, params = _parse_request(request)
+
+    # Get the function from registry
+    if function_name not in dispatcher:
+        raise LookupError(f'Function {function_name} not found')
+
+    cache_key = None
+    if RESULT_CACHE_SIZE > 0 and function_name in CACHEABLE_FUNCTIONS:
+        cache_key = _fingerprint(request, tables, _shm_params(params))
+
+    if cache_key is not None and cache_key in RESULT_CACHE:
+        RESULT_CACHE.move_to_end(cache_key)
+        return RESULT_CACHE[cache_key][0]
+
+    result = _call(function_name, params, tables)
+    if cache_key is not None:
+        _cache_result(cache_key, result)
+    return result
+
+# pd.to_numeric downcast targets by dtype kind
+_DOWNCAST_KINDS = {'f': 'float', 'i': 'integer', 'u': 'unsigned'}
+
+def _downcast(df):
+    """
+    Shrink numeric columns to the smallest float/integer dtype holding their
+    values, keeping the signedness of integer columns
+    """
+    columns = {}
+    for column in df.columns:
+        downcast = _DOWNCAST_KINDS.get(df[column].dtype.kind)
+        if downcast is not None:
+            columns[column] = pd.to_numeric(df[column], downcast=downcast)
+    return df.assign(**columns) if columns else df
+
+def _call(function_name, params, tables=()):
+    """Build a request's DataFrame params and call its function"""
+    # '_downcast' is a bridge option, not a function argument. It's opt-in
+    # since float64 -> float32 loses precision
+    downcast = params.get('_downcast', False)
+    if '_downcast' in params:
+        params = {key: value for key, value in params.items() if key != '_downcast'}
+
+    # Process DataFrame parameters if needed. Payloads are only fingerprinted
+    # for deduplication when more than one could be a duplicate
+    frames = [key for key, value in params.items() if _is_data_param(value)]
+    if len(frames) > 1:
+        built = {}
+        params = {
+            key: _build_param(value, tables, built) if key in frames else value
+            for key, value in params.items()
+        }
+    elif frames:
+        value = params[frames[0]]
+        params = {**params, frames[0]: _PARAM_CONVERTERS[value['type']](value, tables)}
+
+    # Call the function
+    function, params = dispatcher.resolve(function_name, params)
+    if tables and function_name in TABLE_FUNCTIONS:
+        params = {**params, '_tables': tables}
+    result = function(**params)
+    if downcast:
+        if isinstance(result, pd.DataFrame):
+            result = _downcast(result)
+        elif isinstance(result, tuple) and result and isinstance(result[0], pd.DataFrame):
+            result = (_downcast(result[0]),) + result[1:]
+    return result
+
+def process_request(request, tables=(), result_tables=None):
+    """
+    Process a single request and return the serialized response.
+
+    Args:
+        request: The JSON request, as bytes or str
+        tables: Arrow IPC payloads referenced by {'type': 'arrow'} params
+        result_tables: When given, DataFrames in the result are appended to
+            this list as Arrow IPC payloads instead of being inlined as JSON
+
+    Returns:
+        The JSON response as bytes
+    """
     try:
-        # Parse request
-        data = json.loads(request)
-        function_name = data['function']
-        params = data['params']
-        
-        # Get the function from registry
-        if function_name not in function_registry:
-            return json.dumps({'error': f'Function {function_name} not found'})
-        
-        function = function_registry[function_name]
-        
-        # Process DataFrame parameters if needed
-        for key, value in params.items():
-            if isinstance(value, dict) and value.get('type') == 'dataframe':
-                params[key] = pd.DataFrame(value['data'])
-        
-        # Call the function
-        result = function(**params)
-        
+        result = _execute(request, tables)
+
         # Serialize and return the result
-        return json.dumps({
+        if result_tables is not None:
+            return _dumps({'result': result}, default=_arrow_default(result_tables))
+        return _dumps({
             'result': result
-        }, cls=NumpyEncoder)
+        })
+    except RequestError as e:
+        return e.response
     except Exception as e:
-        return json.dumps({'error': str(e)})
+        if result_tables:
+            result_tables.clear()
+        return _dumps({'error': str(e)})
+
+def _stream_default(streams):
+    """Build a default() hook that defers DataFrame columns to chunk frames"""
+    def default(obj):
+        if isinstance(obj, pd.DataFrame):
+            streams.append(obj)
+            return {
+                'type': 'stream',
+                'ref': len(streams) - 1,
+                'columns': list(obj.columns),
+                'n_chunks': len(obj.columns)
+            }
+        return _default(obj)
+    return default
+
+def stream_request(request):
+    """
+    Process a single request, yielding the serialized response as frames.
+
+    The first frame is the JSON response. Each DataFrame in the result is
+    replaced by {'type': 'stream', 'ref': i, 'columns': [...], 'n_chunks': k}
+    and followed by k frames of {'ref': i, 'column': name, 'data': [...]},
+    in ref order, so only one serialized column is held at a time.
+    """
+    streams = []
+    try:
+        result = _execute(request)
+        header = _dumps({'result': result}, default=_stream_default(streams))
+    except RequestError as e:
+        yield e.response
+        return
+    except Exception as e:
+        yield _dumps({'error': str(e)})
+        return
+
+    yield header
+    for ref, df in enumerate(streams):
+        for column in df.columns:
+            try:
+                yield _dumps({'ref': ref, 'column': column, 'data': _ndarray_encode(df[column].to_numpy())})
+            except Exception as e:
+                yield _dumps({'ref': ref, 'column': column, 'error': str(e)})
+
+def _warmup():
+    """
+    Run a tiny DFS so the primitive registry, pandas/woodwork dtype machinery
+    and the JSON codec are initialized before the first request arrives
+    """
+    entityset = ft.EntitySet('_warmup')
+    entityset.add_dataframe(
+        dataframe_name='t',
+        dataframe=pd.DataFrame({'i': [0, 1], 'v': [1.0, 2.0]}),
+        index='i'
+    )
+    feature_matrix, _ = ft.dfs(entityset=entityset, target_dataframe_name='t', max_depth=1)
+    _dumps(feature_matrix)
 
 # Main loop to process stdin requests
 if __name__ == "__main__":
-    for line in sys.stdin:
-        response = process_request(line)
-        sys.stdout.write(response + '\n')
-        sys.stdout.flush() 
\ No newline at end of file
+    if os.environ.get('FT_BRIDGE_WARMUP', '1') == '1':
+        # Warmup is only an optimization - a failure mustn't stop the bridge
+        # from serving requests
+        try:
+            _warmup()
+        except Exception as e:
+            print(f"Warmup failed: {e}", file=sys.stderr)
+
+    # The loops below bind hot callables to locals to skip repeated global and
+    # attribute lookups per request
+    stdout = sys.stdout.buffer
+    write = stdout.write
+    flush = stdout.flush
+    if TRANSPORT == 'arrow':
+        if not PYARROW_AVAILABLE:
+            print("pyarrow is required for FT_BRIDGE_TRANSPORT=arrow", file=sys.stderr)
+            sys.exit(1)
+        stdin = sys.stdin.buffer
+        read_message = _read_arrow_message
+        write_message = _write_arrow_message
+        handle = process_request
+        while True:
+            request, tables = read_message(stdin)
+            if request is None:
+                break
+            result_tables = []
+            response = handle(request, tables, result_tables)
+            write_message(stdout, response, result_tables)
+            flush()
+    elif TRANSPORT == 'framed':
+        # Length-prefixed frames avoid scanning for newlines and let request
+        # bodies carry raw bytes
+        stdin = sys.stdin.buffer
+        read_frame = _read_frame
+        write_frame = _write_frame
+        handle = stream_request
+        while True:
+            request = read_frame(stdin)
+            if request is None:
+                break
+            for frame in handle(request):
+                write_frame(stdout, frame)
+                flush()
+    else:
+        # Requests stay UTF-8 bytes all the way into the parser rather than
+        # being decoded to str and re-encoded
+        handle = process_request
+        for line in sys.stdin.buffer:
+            write(handle(line) + b'\n')
+            flush()
\ No newline at end of file
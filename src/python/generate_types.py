@@ -4,8 +4,10 @@ import json
 import sys
 import os
 import textwrap
-import warnings
 import time
+import atexit
+import hashlib
+import pickle
 import multiprocessing
 from functools import lru_cache
 # Replace direct typing imports with our compatibility module
@@ -16,7 +18,14 @@ import version_compat as vc
 from version_compat import (
     get_type_hints_compat, get_origin_compat, get_args_compat,
     Protocol, TypedDict, Literal, is_protocol, is_typed_dict,
-    is_union_type, is_optional_type, VERSION_INFO
+    is_optional_type, VERSION_INFO
+)
+
+# AST-based stub extraction, compiled with mypyc when available
+import stub_extract
+from stub_extract import (
+    extract_class_from_stub, extract_function_from_stub,
+    format_literal, ANNOTATION_CACHE
 )
 
 # Import scikit-learn support if enabled
@@ -34,15 +43,27 @@ else:
 from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import importlib
 import typing
+import types
+import collections.abc
 import re
 import glob
 import ast
 from pathlib import Path
 import datetime
+from array import array
+
+# Debug output is resolved once - DEBUG doesn't change during a run
+_DEBUG = bool(os.environ.get('DEBUG'))
+
+# Environment flag values that switch a default-on feature off
+_FALSY = frozenset(('false', '0', ''))
+
+# TypeScript 4.9+ output features, likewise resolved once
+_USE_TS49 = os.environ.get('USE_TS_49_FEATURES', 'true').lower() not in _FALSY
 
 # Log Python version info for debugging
-if os.environ.get('DEBUG'):
-    print(f"[INFO] Python {VERSION_INFO['major']}.{VERSION_INFO['minor']}.{VERSION_INFO['micro']}", file=sys.stderr)
+if _DEBUG:
+    print(f"[INFO] Python {VERSION_INFO.major}.{VERSION_INFO.minor}.{VERSION_INFO.micro}", file=sys.stderr)
     if vc.PY36:
         print("[INFO] Running in Python 3.6 compatibility mode", file=sys.stderr)
     elif vc.PY37:
@@ -56,11 +77,14 @@ if os.environ.get('DEBUG'):
 
 # Performance measurement
 start_time = time.time()
-def log_perf(message):
-    """Log performance message with elapsed time"""
-    if os.environ.get('DEBUG'):
+if _DEBUG:
+    def log_perf(message):
+        """Log performance message with elapsed time"""
         elapsed = time.time() - start_time
         print(f"[PERF] {elapsed:.3f}s - {message}", file=sys.stderr)
+else:
+    def log_perf(message):
+        """Performance logging is disabled without DEBUG"""
 
 log_perf("Starting type generation script")
 
@@ -80,41 +104,12 @@ try:
     log_perf("Imported featuretools")
 except ImportError:
     FEATURETOOLS_AVAILABLE = False
+    import warnings
     warnings.warn("Featuretools package is not installed. Using mock definitions for type generation.")
     
-    # Define mock classes for when featuretools isn't available
-    class EntitySetMock:
-        def __init__(self, id, entities=None, relationships=None):
-            pass
-            
-    class EntityMock:
-        def __init__(self, id, df, index, time_index=None, variable_types=None):
-            pass
-            
-    class RelationshipMock:
-        def __init__(self, parent_entity, parent_variable, child_entity, child_variable):
-            pass
-    
-    # Create mock module structure        
-    class FTMock:
-        EntitySet = EntitySetMock
-        Entity = EntityMock
-        Relationship = RelationshipMock
-        
-        def dfs(self, entityset, target_entity, **kwargs):
-            pass
-            
-        def calculate_feature_matrix(self, features, entityset, **kwargs):
-            pass
-            
-        class primitives:
-            class AggregationPrimitive:
-                pass
-                
-            class TransformPrimitive:
-                pass
-    
-    ft = FTMock()
+    # Mock classes live in their own module so they're only loaded when needed
+    from _mocks import make_mock_ft
+    ft = make_mock_ft()
     log_perf("Created mock featuretools module")
 
 # Check for typing_inspect, but now we'll use our compatibility layer as fallback
@@ -129,6 +124,11 @@ except ImportError:
 # Cache for storing processed types to avoid redundant computation
 TYPE_CACHE = {}
 
+# Objects are extracted in worker processes once there are enough of them to
+# outweigh the pool startup cost (e.g. with scikit-learn support enabled)
+MAX_WORKERS = int(os.environ.get('MAX_WORKERS') or os.cpu_count() or 1)
+PARALLEL_THRESHOLD = 8
+
 # Target classes/functions to extract types from
 TARGET_OBJECTS = {
     'EntitySet': ft.EntitySet,
@@ -142,6 +142,28 @@ TARGET_OBJECTS = {
     }
 }
 
+def _flatten_targets(targets, prefix=''):
+    """
+    Flatten TARGET_OBJECTS into parallel name/object/is-class arrays.
+
+    Nested groups such as 'primitives' get qualified names, e.g.
+    'primitives.AggregationPrimitive'.
+    """
+    names, objs, is_class = [], [], array('b')
+    for name, obj in targets.items():
+        if isinstance(obj, dict):
+            sub_names, sub_objs, sub_is_class = _flatten_targets(obj, f"{prefix}{name}.")
+            names.extend(sub_names)
+            objs.extend(sub_objs)
+            is_class.extend(sub_is_class)
+        else:
+            names.append(f"{prefix}{name}")
+            objs.append(obj)
+            is_class.append(isinstance(obj, type))
+    return names, objs, is_class
+
+_TARGET_NAMES, _TARGET_OBJS, _TARGET_IS_CLASS = _flatten_targets(TARGET_OBJECTS)
+
 # Map Python types to TypeScript types
 TYPE_MAPPING = {
     str: 'string',
@@ -155,6 +177,11 @@ TYPE_MAPPING = {
     type(None): 'null',
 }
 
+# The keys are permanent builtin singletons, so they can be matched by id()
+# without hashing the type. Stub annotations name their types instead (see
+# stub_extract.TYPE_NAMES)
+_TYPE_MAPPING_BY_ID = {id(py_type): ts_type for py_type, ts_type in TYPE_MAPPING.items() if py_type is not None}
+
 # Load custom type transformations from environment
 TRANSFORMATIONS = {}
 try:
@@ -167,24 +194,127 @@ try:
 except Exception as e:
     print(f"Error loading custom transformations: {str(e)}", file=sys.stderr)
 
+# TYPE_CACHE is persisted here between runs and reused while its fingerprint -
+# Python, featuretools (and scikit-learn) versions, stub files, custom
+# transformations and this script - is unchanged. An empty path disables it
+TYPE_CACHE_PATH = os.environ.get('TYPE_CACHE_PATH', os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'feature-tools-ts',
+    'type_cache.pkl'
+))
+
+def _cache_fingerprint():
+    """Fingerprint everything the cached types are derived from"""
+    parts = [sys.version, str(getattr(ft, '__version__', None)), str(FEATURETOOLS_AVAILABLE)]
+    if SCIKIT_LEARN_AVAILABLE:
+        parts.append(str(scikit_learn_support.get_sklearn_version()))
+    
+    # Files are identified by path and modification time
+    files = sorted(_STUB_INDEX.values())
+    # This script and the modules doing the extraction for it
+    modules = [stub_extract, vc]
+    if SCIKIT_LEARN_AVAILABLE:
+        modules.append(scikit_learn_support)
+    if not FEATURETOOLS_AVAILABLE:
+        modules.append(sys.modules['_mocks'])
+    files.append(os.path.abspath(__file__))
+    files.extend(os.path.abspath(module.__file__) for module in modules)
+    files.append(os.environ.get('CUSTOM_TRANSFORMS_PATH') or '')
+    for path in files:
+        try:
+            parts.append(f"{path}:{os.stat(path).st_mtime_ns}")
+        except OSError:
+            parts.append(path)
+    
+    return hashlib.blake2b('\n'.join(parts).encode('utf-8'), digest_size=16).hexdigest()
+
+def _load_persistent_cache(path, fingerprint):
+    """Load a saved TYPE_CACHE if it was built from the same inputs"""
+    try:
+        with open(path, 'rb') as f:
+            saved_fingerprint, cache, annotations = pickle.load(f)
+    except Exception:
+        return
+    if saved_fingerprint == fingerprint:
+        TYPE_CACHE.update(cache)
+        ANNOTATION_CACHE.update(annotations)
+        log_perf(f"Loaded {len(cache)} cached types from {path}")
+
+def _save_persistent_cache(path, fingerprint):
+    """Atomically write TYPE_CACHE and the stub annotation cache back to disk"""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((fingerprint, TYPE_CACHE, ANNOTATION_CACHE), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        if _DEBUG:
+            print(f"Warning: Couldn't save type cache to {path}: {str(e)}", file=sys.stderr)
+
+def _index_stub_files(typeshed_paths):
+    """
+    Map module names to stub files, scanning each typeshed path once.
+
+    Earlier typeshed paths take precedence, and within a path a module's own
+    stub takes precedence over a package __init__ stub.
+    """
+    index = {}
+    for typeshed_path in typeshed_paths:
+        modules, packages = {}, {}
+        for root, _, files in os.walk(typeshed_path):
+            rel_root = os.path.relpath(root, typeshed_path)
+            parts = [] if rel_root == os.curdir else rel_root.split(os.sep)
+            for filename in files:
+                if not filename.endswith('.pyi'):
+                    continue
+                stub_path = os.path.join(root, filename)
+                if filename == '__init__.pyi':
+                    packages['.'.join(parts)] = stub_path
+                else:
+                    modules['.'.join(parts + [filename[:-4]])] = stub_path
+        for module_name, stub_path in {**packages, **modules}.items():
+            index.setdefault(module_name, stub_path)
+    return index
+
+_STUB_INDEX = _index_stub_files(TYPESHED_PATHS)
+
 # Function to find stub files for a module
+@lru_cache(maxsize=None)
 def find_stub_file(module_name):
     """Find a .pyi stub file for the given module name"""
-    module_path = module_name.replace('.', '/')
-    
-    # Check in all typeshed paths
-    for typeshed_path in TYPESHED_PATHS:
-        # Check for direct module stub
-        stub_path = os.path.join(typeshed_path, f"{module_path}.pyi")
-        if os.path.exists(stub_path):
-            return stub_path
-            
-        # Check for package __init__ stub
-        init_stub_path = os.path.join(typeshed_path, module_path, "__init__.pyi")
-        if os.path.exists(init_stub_path):
-            return init_stub_path
-            
-    return None
+    return _STUB_INDEX.get(module_name)
+
+# Parsed stub files keyed by path, as (tree, {name: definition node})
+_STUB_AST_CACHE = {}
+
+def _read_and_parse(stub_path):
+    """Read and parse a stub file once, indexing its class/function definitions by name"""
+    entry = _STUB_AST_CACHE.get(stub_path)
+    if entry is None:
+        with open(stub_path, 'r') as f:
+            tree = ast.parse(f.read())
+        
+        # Targets are declared at module level, so only the top level is
+        # indexed. The first definition of a name wins (e.g. with @overload)
+        index = {}
+        for node in tree.body:
+            if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+                index.setdefault(node.name, node)
+        entry = _STUB_AST_CACHE[stub_path] = (tree, index)
+    return entry
+
+def prewarm_stubs(stub_paths):
+    """Read and parse stub files concurrently, overlapping their file I/O"""
+    def parse(stub_path):
+        try:
+            _read_and_parse(stub_path)
+        except Exception as e:
+            if _DEBUG:
+                print(f"Error parsing stub file {stub_path}: {str(e)}", file=sys.stderr)
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(parse, stub_paths))
 
 # Parse a stub file to extract type information
 def parse_stub_file(stub_path, target_name=None):
@@ -192,216 +322,29 @@ def parse_stub_file(stub_path, target_name=None):
     log_perf(f"Parsing stub file: {stub_path}")
     
     try:
-        with open(stub_path, 'r') as f:
-            stub_content = f.read()
-            
-        # Parse the stub file
-        tree = ast.parse(stub_content)
+        tree, index = _read_and_parse(stub_path)
         
         # If we're looking for a specific target, find it
         if target_name:
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and node.name == target_name:
-                    return extract_class_from_stub(node, stub_content)
-                elif isinstance(node, ast.FunctionDef) and node.name == target_name:
-                    return extract_function_from_stub(node, stub_content)
+            node = index.get(target_name)
+            if isinstance(node, ast.ClassDef):
+                return extract_class_from_stub(node)
+            elif isinstance(node, ast.FunctionDef):
+                return extract_function_from_stub(node)
         else:
             # Extract all top-level definitions
             result = {}
             for node in tree.body:
                 if isinstance(node, ast.ClassDef):
-                    result[node.name] = extract_class_from_stub(node, stub_content)
+                    result[node.name] = extract_class_from_stub(node)
                 elif isinstance(node, ast.FunctionDef):
-                    result[node.name] = extract_function_from_stub(node, stub_content)
+                    result[node.name] = extract_function_from_stub(node)
             return result
     except Exception as e:
-        if os.environ.get('DEBUG'):
+        if _DEBUG:
             print(f"Error parsing stub file {stub_path}: {str(e)}", file=sys.stderr)
         return None
 
-def extract_class_from_stub(node, source):
-    """Extract class information from an AST ClassDef node"""
-    class_info = {
-        'type': 'class',
-        'name': node.name,
-        'methods': {},
-        'properties': {},
-        'doc': ast.get_docstring(node) or ""
-    }
-    
-    # Extract methods and properties
-    for item in node.body:
-        if isinstance(item, ast.FunctionDef):
-            # Skip dunder methods except __init__
-            if item.name.startswith('__') and item.name != '__init__':
-                continue
-                
-            method_info = extract_function_from_stub(item, source)
-            class_info['methods'][item.name] = method_info
-        elif isinstance(item, ast.AnnAssign):
-            # This is a property with a type annotation
-            if isinstance(item.target, ast.Name):
-                prop_name = item.target.id
-                prop_type = extract_annotation_from_stub(item.annotation, source)
-                class_info['properties'][prop_name] = {
-                    'type': prop_type,
-                    'optional': False  # Assume required unless marked optional
-                }
-    
-    return class_info
-
-def extract_function_from_stub(node, source):
-    """Extract function information from an AST FunctionDef node"""
-    func_info = {
-        'type': 'function',
-        'name': node.name,
-        'params': [],
-        'return_type': 'any',
-        'doc': ast.get_docstring(node) or ""
-    }
-    
-    # Extract return type
-    if node.returns:
-        func_info['return_type'] = extract_annotation_from_stub(node.returns, source)
-    
-    # Extract parameters
-    for param in node.args.args:
-        # Skip 'self' parameter
-        if param.arg == 'self':
-            continue
-            
-        param_info = {
-            'name': param.arg,
-            'type': 'any',
-            'optional': False
-        }
-        
-        # Extract parameter type
-        if param.annotation:
-            param_info['type'] = extract_annotation_from_stub(param.annotation, source)
-        
-        func_info['params'].append(param_info)
-    
-    # Handle default values (optional parameters)
-    defaults_offset = len(node.args.args) - len(node.args.defaults)
-    for i, default in enumerate(node.args.defaults):
-        param_index = i + defaults_offset
-        if param_index < len(func_info['params']):
-            func_info['params'][param_index]['optional'] = True
-    
-    return func_info
-
-def extract_annotation_from_stub(annotation, source):
-    """Extract type annotation from an AST node with Python version compatibility"""
-    if isinstance(annotation, ast.Name):
-        # Simple type like 'str', 'int', etc.
-        type_name = annotation.id
-        return TYPE_MAPPING.get(type_name, type_name)
-    elif isinstance(annotation, ast.Subscript):
-        # Generic type like List[str], Dict[str, int], etc.
-        if isinstance(annotation.value, ast.Name):
-            container_type = annotation.value.id
-            
-            # Get the slice part based on Python version
-            if vc.PY36 or vc.PY37 or vc.PY38:
-                # Python 3.6-3.8 uses Index
-                if isinstance(annotation.slice, ast.Index):
-                    slice_value = annotation.slice.value
-                    if isinstance(slice_value, ast.Tuple):
-                        slice_elts = slice_value.elts
-                    else:
-                        slice_elts = [slice_value]
-                else:
-                    # Fallback for other slice types
-                    return container_type
-            else:
-                # Python 3.9+ changed the AST for subscripts
-                slice_value = annotation.slice
-                if isinstance(slice_value, ast.Tuple):
-                    slice_elts = slice_value.elts
-                else:
-                    slice_elts = [slice_value]
-            
-            # Process different container types
-            if container_type in ('List', 'list'):
-                if len(slice_elts) > 0:
-                    value_type = extract_annotation_from_stub(slice_elts[0], source)
-                    return f"{value_type}[]"
-                return "any[]"
-            elif container_type in ('Dict', 'dict'):
-                if len(slice_elts) >= 2:
-                    key_type = extract_annotation_from_stub(slice_elts[0], source)
-                    value_type = extract_annotation_from_stub(slice_elts[1], source)
-                    
-                    if key_type == 'str' or key_type == 'string':
-                        return f"Record<string, {value_type}>"
-                    else:
-                        return f"Record<{key_type}, {value_type}>"
-                return "Record<string, any>"
-            elif container_type == 'Optional':
-                if len(slice_elts) > 0:
-                    inner_type = extract_annotation_from_stub(slice_elts[0], source)
-                    return f"{inner_type} | null"
-                return "any | null"
-            elif container_type == 'Union':
-                types = [extract_annotation_from_stub(elt, source) for elt in slice_elts]
-                
-                # Check if it's an Optional (Union with None)
-                if 'None' in types or 'null' in types:
-                    non_none_types = [t for t in types if t != 'None' and t != 'null']
-                    if len(non_none_types) == 1:
-                        return f"{non_none_types[0]} | null"
-                    else:
-                        return f"({' | '.join(non_none_types)}) | null"
-                else:
-                    return ' | '.join(types)
-            elif container_type == 'Literal':
-                literals = []
-                for elt in slice_elts:
-                    if isinstance(elt, ast.Constant):
-                        if isinstance(elt.value, str):
-                            literals.append(f"'{elt.value}'")
-                        elif elt.value is None:
-                            literals.append('null')
-                        else:
-                            literals.append(str(elt.value).lower())
-                    elif isinstance(elt, ast.Str):  # Python 3.6-3.7
-                        literals.append(f"'{elt.s}'")
-                    elif isinstance(elt, ast.Num):  # Python 3.6-3.7
-                        literals.append(str(elt.n).lower())
-                    elif isinstance(elt, ast.NameConstant):  # Python 3.6-3.7
-                        if elt.value is None:
-                            literals.append('null')
-                        else:
-                            literals.append(str(elt.value).lower())
-                return ' | '.join(literals) if literals else 'any'
-            else:
-                # Other generic types
-                return container_type
-    elif isinstance(annotation, ast.Constant):
-        # Literal values (Python 3.8+)
-        if annotation.value is None:
-            return 'null'
-        else:
-            return str(annotation.value)
-    elif isinstance(annotation, ast.Str):  # Python 3.6-3.7
-        return f"'{annotation.s}'"
-    elif isinstance(annotation, ast.Num):  # Python 3.6-3.7
-        return str(annotation.n)
-    elif isinstance(annotation, ast.NameConstant):  # Python 3.6-3.7
-        if annotation.value is None:
-            return 'null'
-        return str(annotation.value).lower()
-    elif isinstance(annotation, ast.Attribute):
-        # Qualified names like module.Type
-        return annotation.attr
-    elif isinstance(annotation, ast.Ellipsis):
-        # ... (ellipsis)
-        return 'any'
-    
-    # Default to 'any' for complex or unsupported annotations
-    return 'any'
-
 # Use version_compat for Protocol class checks
 @lru_cache(maxsize=128)
 def is_protocol_class(cls):
@@ -422,12 +365,25 @@ def extract_methods_from_protocol(cls):
         
     methods = {}
     
+    # Walk the class dicts along the MRO rather than inspect.getmembers(), so
+    # names are filtered before any attribute access. Subclass definitions
+    # shadow inherited ones, and names are visited in sorted order as before
+    members = {}
+    for klass in cls.__mro__:
+        if klass is object:
+            break
+        for name, value in vars(klass).items():
+            # Skip magic methods and private attributes
+            if name in members or (name.startswith('_') and name != '__call__'):
+                continue
+            if isinstance(value, (staticmethod, classmethod)):
+                # Bind as getattr() would, dropping cls from classmethods
+                value = value.__get__(None, cls)
+            members[name] = value
+    
     # Get all attributes that look like methods
-    for name, value in inspect.getmembers(cls):
-        # Skip magic methods and private attributes
-        if name.startswith('_') and name != '__call__':
-            continue
-            
+    for name in sorted(members):
+        value = members[name]
         if inspect.isfunction(value) or inspect.ismethod(value) or inspect.ismethoddescriptor(value):
             try:
                 # Get method signature and docstring
@@ -468,80 +424,90 @@ def extract_methods_from_protocol(cls):
                     'doc': doc
                 }
             except Exception as e:
-                if os.environ.get('DEBUG'):
+                if _DEBUG:
                     print(f"Warning: Failed to process method {name} in Protocol {cls.__name__}: {str(e)}", file=sys.stderr)
     
     # Cache the result
     TYPE_CACHE[cache_key] = methods
     return methods
 
+def _ts_union(args):
+    # Handle Optional (Union with None)
+    if type(None) in args or None in args:
+        non_none_args = [arg for arg in args if arg is not type(None) and arg is not None]
+        if len(non_none_args) == 1:
+            return f"{get_ts_type(non_none_args[0])} | null"
+        return f"({' | '.join([get_ts_type(arg) for arg in non_none_args])}) | null"
+    return ' | '.join([get_ts_type(arg) for arg in args])
+
+def _ts_list(args):
+    if args:
+        return f"{get_ts_type(args[0])}[]"
+    return "any[]"
+
+def _ts_dict(args):
+    if len(args) == 2:
+        key_type = get_ts_type(args[0])
+        value_type = get_ts_type(args[1])
+        if key_type == 'string':
+            return f"Record<string, {value_type}>"
+        return f"Record<{key_type}, {value_type}>"
+    return "Record<string, any>"
+
+def _ts_literal(args):
+    # Other values (e.g. enum members) are quoted as strings
+    return ' | '.join([
+        format_literal(arg) if arg is None or isinstance(arg, (str, int, float)) else f"'{arg}'"
+        for arg in args
+    ])
+
+# Generic origins mapped to handlers taking the type's args. List/Dict are
+# the origins on Python 3.6, list/dict on 3.7+
+_ORIGIN_HANDLERS = {
+    typing.Union: _ts_union,
+    list: _ts_list,
+    List: _ts_list,
+    collections.abc.Sequence: _ts_list,
+    collections.abc.Iterable: _ts_list,
+    dict: _ts_dict,
+    Dict: _ts_dict,
+    Literal: _ts_literal,
+}
+if hasattr(types, 'UnionType'):
+    # X | Y unions (Python 3.10+)
+    _ORIGIN_HANDLERS[types.UnionType] = _ts_union
+
 # Update to use version_compat functions
-@lru_cache(maxsize=256)
 def get_ts_type(py_type):
     """Convert Python type to TypeScript type with custom transformation support"""
+    try:
+        hash(py_type)
+    except TypeError:
+        # Unhashable objects can't be looked up in the cache or in
+        # TYPE_MAPPING, and aren't types we can map anyway
+        return 'any'
+    return _get_ts_type_cached(py_type)
+
+def _get_ts_type(py_type):
+    """Convert Python type to TypeScript type, without caching"""
     if py_type is None:
         return 'any'
     
-    # Check if the type is already in the cache
-    type_key = str(py_type)
-    if type_key in TYPE_CACHE:
-        return TYPE_CACHE[type_key]
-        
-    result = None
+    mapped = _TYPE_MAPPING_BY_ID.get(id(py_type))
+    origin = get_origin_compat(py_type) if mapped is None else None
+    handler = _ORIGIN_HANDLERS.get(origin) if origin is not None else None
     
-    if py_type is None:
-        result = 'any'
+    # Builtin types resolve by identity before any other check
+    if mapped is not None:
+        result = mapped
     
     # Handle Protocol classes (structural types)
     elif inspect.isclass(py_type) and is_protocol_class(py_type):
         result = py_type.__name__
     
-    # Handle Union types (e.g., Optional)
-    elif is_union_type(py_type):
-        args = get_args_compat(py_type)
-        # Handle Optional (Union with None)
-        if type(None) in args or None in args:
-            non_none_args = [arg for arg in args if arg is not type(None) and arg is not None]
-            if len(non_none_args) == 1:
-                result = f"{get_ts_type(non_none_args[0])} | null"
-            else:
-                result = f"({' | '.join([get_ts_type(arg) for arg in non_none_args])}) | null"
-        else:
-            result = ' | '.join([get_ts_type(arg) for arg in args])
-    
-    # Handle List[X], Sequence[X], Iterable[X], etc.
-    elif get_origin_compat(py_type) in (list, List) or str(get_origin_compat(py_type)) == 'list':
-        args = get_args_compat(py_type)
-        if args:
-            result = f"{get_ts_type(args[0])}[]"
-        else:
-            result = "any[]"
-    
-    # Handle Dict[K, V]
-    elif get_origin_compat(py_type) in (dict, Dict) or str(get_origin_compat(py_type)) == 'dict':
-        args = get_args_compat(py_type)
-        if len(args) == 2:
-            key_type = get_ts_type(args[0])
-            value_type = get_ts_type(args[1])
-            if key_type == 'string':
-                result = f"Record<string, {value_type}>"
-            else:
-                result = f"Record<{key_type}, {value_type}>"
-        else:
-            result = "Record<string, any>"
-    
-    # Handle Literal types
-    elif get_origin_compat(py_type) is Literal or str(get_origin_compat(py_type)) == 'Literal':
-        args = get_args_compat(py_type)
-        literals = []
-        for arg in args:
-            if isinstance(arg, str):
-                literals.append(f"'{arg}'")
-            elif isinstance(arg, (int, float, bool)):
-                literals.append(str(arg).lower())
-            else:
-                literals.append(f"'{str(arg)}'")
-        result = ' | '.join(literals)
+    # Handle Union/Optional, List[X], Dict[K, V] and Literal types
+    elif handler is not None:
+        result = handler(get_args_compat(py_type))
     
     # Handle TypedDict
     elif is_typed_dict(py_type):
@@ -552,7 +518,7 @@ def get_ts_type(py_type):
             properties.append(f"  {key}: {get_ts_type(value)}")
         result = "{\n" + ",\n".join(properties) + "\n}"
     
-    # For standard types
+    # For other types equal to a standard type
     elif py_type in TYPE_MAPPING:
         result = TYPE_MAPPING[py_type]
     
@@ -565,6 +531,16 @@ def get_ts_type(py_type):
         result = 'any'
     
     # Apply custom transformations if available
+    if TRANSFORMATIONS:
+        result = _apply_transformation(py_type, result)
+    
+    return result
+
+# Results are cached on the type itself rather than its (costly) str()
+_get_ts_type_cached = lru_cache(maxsize=4096)(_get_ts_type)
+
+def _apply_transformation(py_type, result):
+    """Apply the custom transformation registered for a type, if any"""
     type_name = getattr(py_type, '__name__', str(py_type))
     module_name = getattr(py_type, '__module__', '')
     
@@ -587,10 +563,6 @@ def get_ts_type(py_type):
         except Exception as e:
             print(f"Error applying transformation for {fq_name}: {str(e)}", file=sys.stderr)
     
-    # Cache the result
-    if result is not None:
-        TYPE_CACHE[type_key] = result
-    
     return result
 
 @lru_cache(maxsize=128)
@@ -620,13 +592,15 @@ def generate_interface_from_class(cls, name=None):
     docstring = extract_docstring(cls)
     
     # Check if this is a Protocol class
-    if is_protocol_class(cls):
+    is_protocol = is_protocol_class(cls)
+    if is_protocol:
         # For Protocol classes, focus on extracting methods
         methods = extract_methods_from_protocol(cls)
         
         # Also check for property annotations in the Protocol
-        if hasattr(cls, '__annotations__'):
-            for prop_name, prop_type in cls.__annotations__.items():
+        annotations = getattr(cls, '__annotations__', None)
+        if annotations:
+            for prop_name, prop_type in annotations.items():
                 properties[prop_name] = {
                     'type': get_ts_type(prop_type),
                     'optional': True,  # Protocols often have optional properties
@@ -639,7 +613,7 @@ def generate_interface_from_class(cls, name=None):
             # Use our compatibility function
             type_hints = get_type_hints_compat(cls.__init__)
         except (ValueError, TypeError) as e:
-            if os.environ.get('DEBUG'):
+            if _DEBUG:
                 print(f"Warning: Couldn't get signature for {name}: {str(e)}", file=sys.stderr)
             signature = inspect.Signature()
             type_hints = {}
@@ -670,7 +644,7 @@ def generate_interface_from_class(cls, name=None):
         'properties': properties,
         'methods': methods,
         'docstring': docstring,
-        'is_protocol': is_protocol_class(cls)
+        'is_protocol': is_protocol
     }
     
     # Cache the result
@@ -696,12 +670,13 @@ def generate_interface_from_function(func, name=None):
         # Use our compatibility function
         type_hints = get_type_hints_compat(func)
     except (ValueError, TypeError) as e:
-        if os.environ.get('DEBUG'):
+        if _DEBUG:
             print(f"Warning: Couldn't get signature for {name}: {str(e)}", file=sys.stderr)
         signature = inspect.Signature()
         type_hints = {}
     
-    for param_name, param in signature.parameters.items():
+    parameters = signature.parameters.items()
+    for param_name, param in parameters:
         param_doc = ""
         if param_name in type_hints:
             py_type = type_hints[param_name]
@@ -737,42 +712,44 @@ def generate_interface_from_function(func, name=None):
     TYPE_CACHE[cache_key] = result
     return result
 
+# Optional marker indexed by the 'optional' flag
+_OPTIONAL_MARK = ('', '?')
+
+def _render_property(prop_name, prop_data):
+    """Render a property line, preceded by its docstring if available"""
+    line = f"  {prop_name}{_OPTIONAL_MARK[bool(prop_data['optional'])]}: {prop_data['type']};"
+    if prop_data.get('doc'):
+        return f"  /** {prop_data['doc']} */\n{line}"
+    return line
+
+def _render_method(method_name, method_data):
+    """Render a method declaration, preceded by its docstring if available"""
+    params = ', '.join(
+        f"{param['name']}{_OPTIONAL_MARK[bool(param['optional'])]}: {param['type']}"
+        for param in method_data['params']
+    )
+    line = f"  {method_name}({params}): {method_data['return_type']};"
+    if method_data.get('doc'):
+        return f"  /** {method_data['doc']} */\n{line}"
+    return line
+
 def render_ts_interface(interface_data):
     """Render TypeScript interface as string with JSDoc comments"""
-    lines = []
-    
-    # Add docstring if available
-    if interface_data.get('docstring'):
-        lines.append(interface_data['docstring'])
-    
-    lines.append(f"export interface {interface_data['name']} {{")
-    
-    # Add properties
-    for prop_name, prop_data in interface_data.get('properties', {}).items():
-        # Add property docstring if available
-        if prop_data.get('doc'):
-            lines.append(f"  /** {prop_data['doc']} */")
-            
-        optional = '?' if prop_data['optional'] else ''
-        lines.append(f"  {prop_name}{optional}: {prop_data['type']};")
-    
-    # Add methods for Protocol interfaces
-    for method_name, method_data in interface_data.get('methods', {}).items():
-        # Add method docstring if available
-        if method_data.get('doc'):
-            lines.append(f"  /** {method_data['doc']} */")
-        
-        # Format method parameters
-        params = []
-        for param in method_data['params']:
-            optional = '?' if param['optional'] else ''
-            params.append(f"{param['name']}{optional}: {param['type']}")
-        
-        # Add method declaration
-        lines.append(f"  {method_name}({', '.join(params)}): {method_data['return_type']};")
-    
-    lines.append("}")
-    return "\n".join(lines)
+    docstring = interface_data.get('docstring')
+    header = f"export interface {interface_data['name']} {{"
+    
+    # Properties, then methods for Protocol interfaces, each rendered in one
+    # pass and joined once
+    body = '\n'.join([
+        *(_render_property(name, data) for name, data in interface_data.get('properties', {}).items()),
+        *(_render_method(name, data) for name, data in interface_data.get('methods', {}).items()),
+    ])
+    
+    parts = [docstring, header] if docstring else [header]
+    if body:
+        parts.append(body)
+    parts.append('}')
+    return '\n'.join(parts)
 
 def process_object(obj_name, obj, is_class=True):
     """Process a single object (class or function) to extract type information"""
@@ -793,6 +770,41 @@ def process_object(obj_name, obj, is_class=True):
     else:
         return extract_function_info(obj)
 
+def _process_object_task(task):
+    """
+    Process one (name, obj, is_class) task in a worker, returning the type
+    cache entries it added too
+    """
+    cached = set(TYPE_CACHE)
+    info = process_object(*task)
+    return info, {key: value for key, value in TYPE_CACHE.items() if key not in cached}
+
+def process_objects(tasks):
+    """
+    Process (name, obj, is_class) tasks, in parallel when there are enough of them.
+
+    Returns:
+        The extracted type information, in task order
+    """
+    if len(tasks) >= PARALLEL_THRESHOLD and MAX_WORKERS > 1:
+        workers = min(MAX_WORKERS, len(tasks))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # A few chunks per worker keeps the load balanced while
+                # sending each worker's tasks in few round trips
+                chunksize = max(1, len(tasks) // (workers * 4))
+                results = list(executor.map(_process_object_task, tasks, chunksize=chunksize))
+            # Keep the workers' cached types for later lookups in this process
+            for _, cache in results:
+                TYPE_CACHE.update(cache)
+            log_perf(f"Processed {len(tasks)} objects with {workers} workers")
+            return [info for info, _ in results]
+        except Exception as e:
+            # Objects that can't be pickled (or a broken pool) fall back to serial
+            if _DEBUG:
+                print(f"Warning: Parallel extraction failed, falling back to serial: {str(e)}", file=sys.stderr)
+    return [process_object(*task) for task in tasks]
+
 def extract_class_info(obj):
     """Extract class information through runtime inspection"""
     interface_data = generate_interface_from_class(obj)
@@ -831,33 +843,15 @@ def extract_function_info(obj):
     
     return result
 
-def generate_ts_types():
-    """Generate TypeScript interfaces from Python types"""
-    # Import featuretools module
-    ft_module = import_featuretools()
-    
-    # Dictionary to store all interfaces
-    interfaces = {}
-    
-    # Process EntitySet class
-    entityset_class = ft_module.EntitySet
-    interfaces['EntitySet'] = process_object('EntitySet', entityset_class)
-    
-    # Process Entity class
-    entity_class = ft_module.Entity
-    interfaces['Entity'] = process_object('Entity', entity_class)
-    
-    # Process Relationship class
-    relationship_class = ft_module.Relationship
-    interfaces['Relationship'] = process_object('Relationship', relationship_class)
-    
-    # Process DFS function
-    dfs_func = ft_module.dfs
-    interfaces['DFS'] = process_object('DFS', dfs_func, is_class=False)
-    
-    # Process calculate_feature_matrix function
-    calc_fm_func = ft_module.calculate_feature_matrix
-    interfaces['CalculateFeatureMatrix'] = process_object('CalculateFeatureMatrix', calc_fm_func, is_class=False)
+def collect_interfaces():
+    """Extract type information for every target object, keyed by name"""
+    # Objects to extract, as (name, obj, is_class) tasks. Stubs are searched
+    # by the unqualified name
+    names = list(_TARGET_NAMES)
+    tasks = [
+        (_TARGET_NAMES[i].rsplit('.', 1)[-1], _TARGET_OBJS[i], bool(_TARGET_IS_CLASS[i]))
+        for i in range(len(_TARGET_NAMES))
+    ]
     
     # Add scikit-learn types if available
     if SCIKIT_LEARN_AVAILABLE:
@@ -872,35 +866,60 @@ def generate_ts_types():
             # Extract the simple name from the full name
             simple_name = name.split('.')[-1]
             
-            # Process the object
-            is_class = isinstance(obj, type)
-            interfaces[simple_name] = process_object(simple_name, obj, is_class=is_class)
-            
-        log_perf(f"Extracted {len(sklearn_types)} scikit-learn types")
+            names.append(simple_name)
+            tasks.append((simple_name, obj, isinstance(obj, type)))
+    
+    # Parse the stubs the objects come from up front, in parallel
+    stub_paths = {find_stub_file(getattr(obj, '__module__', None) or '') for _, obj, _ in tasks}
+    stub_paths.discard(None)
+    if len(stub_paths) > 1:
+        prewarm_stubs(sorted(stub_paths))
     
-    # Render all interfaces to TypeScript
-    ts_output = []
+    # Dictionary to store all interfaces
+    interfaces = {}
+    for name, info in zip(names, process_objects(tasks)):
+        interfaces[name] = info
     
-    # Add header
-    ts_output.append('/**')
-    ts_output.append(' * TypeScript type definitions for Featuretools')
-    ts_output.append(' * Generated automatically - do not modify directly')
-    ts_output.append(f' * Generated on: {datetime.datetime.now().isoformat()}')
-    ts_output.append(' */')
-    ts_output.append('')
+    if SCIKIT_LEARN_AVAILABLE:
+        log_perf(f"Extracted {len(sklearn_types)} scikit-learn types")
     
-    # Add imports
-    ts_output.append('// Type imports')
-    ts_output.append('import type { DataFrame } from "pandas";')
-    ts_output.append('import type { Series } from "pandas";')
-    ts_output.append('import type { ndarray } from "numpy";')
-    ts_output.append('')
+    return interfaces
+
+# Header and imports preceding the interfaces. The timestamp is taken once,
+# when the script starts
+_HEADER_LINES = (
+    '/**',
+    ' * TypeScript type definitions for Featuretools',
+    ' * Generated automatically - do not modify directly',
+    f' * Generated on: {datetime.datetime.now().isoformat()}',
+    ' */',
+    '',
+    '// Type imports',
+    'import type { DataFrame } from "pandas";',
+    'import type { Series } from "pandas";',
+    'import type { ndarray } from "numpy";',
+    '',
+)
+
+def iter_ts_output(interfaces):
+    """Yield the lines of the TypeScript output, rendering one interface at a time"""
+    yield from _HEADER_LINES
     
     # Add interfaces
-    for name, interface_data in interfaces.items():
-        ts_output.append(render_ts_interface(interface_data))
-    
-    return '\n'.join(ts_output)
+    for interface_data in interfaces.values():
+        yield render_ts_interface(interface_data)
+
+def write_ts_output(stream, interfaces):
+    """Write the TypeScript output to a stream as it's rendered, newline-separated"""
+    lines = iter_ts_output(interfaces)
+    stream.write(next(lines))
+    for line in lines:
+        stream.write('\n')
+        stream.write(line)
+
+def generate_ts_types():
+    """Generate TypeScript interfaces from Python types"""
+    return '\n'.join(iter_ts_output(collect_interfaces()))
 
 # Function to import featuretools - returns the module or a mock
 def import_featuretools():
@@ -910,57 +929,65 @@ def import_featuretools():
     else:
         # Return the mock module
         log_perf("Using featuretools mock")
-        return FTMock()
+        from _mocks import make_mock_ft
+        return make_mock_ft()
+
+# Base type names mapped to TypeScript by ts_type_for_python_type
+_PY_TO_TS = {
+    "str": "string",
+    "int": "number",
+    "float": "number",
+    "bool": "boolean",
+    "list": "any[]",  # Would be better to process element type
+    "tuple": "any[]",
+    "dict": "Record<string, any>",
+}
+
+# Nullable strings use PreferType for better type inference on TypeScript 4.9+
+_NULLABLE_STRING_TS = 'PreferType<string, null>' if _USE_TS49 else 'string | null'
 
 # Add the ts_type_for_python_type function back
 def ts_type_for_python_type(py_type, nullable=False):
     """Convert Python type to TypeScript type with TypeScript 4.9+ features if enabled"""
-    # Get the base type using an existing function
-    if callable(getattr(py_type, "__origin__", None)):
+    # Get the base type - generics name their origin, other types themselves
+    try:
         base_type = py_type.__origin__.__name__
-    else:
+    except AttributeError:
         base_type = getattr(py_type, "__name__", str(py_type))
         
     # Convert common Python types to TypeScript
-    if base_type == "str":
-        base_type = "string"
-    elif base_type == "int" or base_type == "float":
-        base_type = "number"
-    elif base_type == "bool":
-        base_type = "boolean"
-    elif base_type == "list" or base_type == "tuple":
-        base_type = "any[]"  # Would be better to process element type
-    elif base_type == "dict":
-        base_type = "Record<string, any>"
-    else:
-        base_type = "any"
-    
-    # Check if we should use TypeScript 4.9+ features
-    use_ts49 = os.environ.get('USE_TS_49_FEATURES', 'true').lower() not in ('false', '0')
+    base_type = _PY_TO_TS.get(base_type, "any")
     
-    # If it's a nullable string, use PreferType for better type inference
-    if base_type == 'string' and nullable and use_ts49:
-        return 'PreferType<string, null>'
-    elif nullable:
-        return f'{base_type} | null'
-    else:
+    if not nullable:
         return base_type
+    if base_type == 'string':
+        return _NULLABLE_STRING_TS
+    return f'{base_type} | null'
 
 # Fix the main function to properly format the output with declare module
 def main():
     """Main function for generating TypeScript types"""
     try:
-        # Generate TypeScript types
-        ts_output = generate_ts_types()
+        # Reuse types from previous runs. This only happens for the CLI, since
+        # the cache is keyed by names which other importers may reuse
+        if TYPE_CACHE_PATH:
+            fingerprint = _cache_fingerprint()
+            _load_persistent_cache(TYPE_CACHE_PATH, fingerprint)
+            atexit.register(_save_persistent_cache, TYPE_CACHE_PATH, fingerprint)
+        
+        # Extract types first, so a failure leaves any existing output intact
+        interfaces = collect_interfaces()
         
-        # Output to stdout or file
+        # Stream the rendered output to stdout or file rather than building
+        # it up as one string
         output_file = os.environ.get('OUTPUT_FILE')
         if output_file:
             with open(output_file, 'w') as f:
-                f.write(ts_output)
+                write_ts_output(f, interfaces)
             print(f"TypeScript types written to {output_file}", file=sys.stderr)
         else:
-            print(ts_output)
+            write_ts_output(sys.stdout, interfaces)
+            sys.stdout.write('\n')
             
         return 0
     except Exception as e:
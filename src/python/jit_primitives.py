@@ -0,0 +1,91 @@
+"""
+Numba JIT support for custom numeric transform primitives used by the bridge
+"""
+import os
+import inspect
+from typing import Any, Callable, List
+
+import numpy as np
+from featuretools.primitives import TransformPrimitive
+from woodwork.column_schema import ColumnSchema
+
+# Numba reads its cache location at import time. Compiled functions are
+# persisted there so later bridge processes skip recompilation
+NUMBA_CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'featuretools_bridge_numba'
+)
+os.environ.setdefault('NUMBA_CACHE_DIR', NUMBA_CACHE_DIR)
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Annotations accepted for element-wise (scalar) and whole-column (array) functions
+SCALAR_TYPES = (int, float)
+ARRAY_TYPES = (np.ndarray,)
+
+def _numeric_kind(func: Callable) -> str:
+    """
+    Classify a function by its annotations.
+
+    Returns:
+        'scalar' or 'array' when every parameter and the return value are
+        annotated with numeric scalars or arrays respectively, '' otherwise
+    """
+    try:
+        signature = inspect.signature(func)
+    except (TypeError, ValueError):
+        return ''
+
+    annotations = [param.annotation for param in signature.parameters.values()]
+    annotations.append(signature.return_annotation)
+    if not signature.parameters:
+        return ''
+    if all(annotation in SCALAR_TYPES for annotation in annotations):
+        return 'scalar'
+    if all(annotation in ARRAY_TYPES for annotation in annotations):
+        return 'array'
+    return ''
+
+def jitify(func: Callable, kind: str = 'array') -> Callable:
+    """Compile a numeric function, falling back to plain numpy without numba"""
+    if kind == 'scalar':
+        if NUMBA_AVAILABLE:
+            return numba.vectorize(cache=True)(func)
+        return np.vectorize(func, otypes=[np.float64])
+    if NUMBA_AVAILABLE:
+        return numba.njit(cache=True)(func)
+    return func
+
+def make_jit_primitive(func: Callable, kind: str) -> type:
+    """Wrap a numeric function in a TransformPrimitive running its jitted version"""
+    jitted = jitify(func, kind)
+    n_inputs = len(inspect.signature(func).parameters)
+
+    def function(*columns):
+        return jitted(*(np.asarray(column, dtype=np.float64) for column in columns))
+
+    return type(f"Jit{func.__name__.title().replace('_', '')}", (TransformPrimitive,), {
+        'name': func.__name__,
+        'input_types': [ColumnSchema(semantic_tags={'numeric'})] * n_inputs,
+        'return_type': ColumnSchema(semantic_tags={'numeric'}),
+        'get_function': lambda self: function,
+    })
+
+def jit_trans_primitives(primitives: List[Any]) -> List[Any]:
+    """
+    Replace numeric callables in a trans_primitives list with jitted primitives.
+
+    Primitive names, primitive classes and callables with non-numeric
+    annotations are passed through unchanged.
+    """
+    result = []
+    for primitive in primitives:
+        kind = ''
+        if callable(primitive) and not isinstance(primitive, type):
+            kind = _numeric_kind(primitive)
+        result.append(make_jit_primitive(primitive, kind) if kind else primitive)
+    return result
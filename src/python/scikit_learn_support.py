@@ -5,8 +5,13 @@ import os
 import sys
 import importlib
 import inspect
+from functools import lru_cache
 from typing import Dict, List, Any, Optional, Union, Tuple
 
+# Scikit-learn support is enabled once per process
+INCLUDE_SCIKIT_LEARN = os.environ.get('INCLUDE_SCIKIT_LEARN') == 'true'
+
+@lru_cache(maxsize=1)
 def is_sklearn_available() -> bool:
     """Check if scikit-learn is available"""
     try:
@@ -15,6 +20,7 @@ def is_sklearn_available() -> bool:
     except ImportError:
         return False
 
+@lru_cache(maxsize=1)
 def get_sklearn_version() -> Optional[str]:
     """Get scikit-learn version if available"""
     if is_sklearn_available():
@@ -22,120 +28,124 @@ def get_sklearn_version() -> Optional[str]:
         return sklearn.__version__
     return None
 
-def import_sklearn_modules() -> Dict[str, Any]:
-    """Import scikit-learn modules and return a dictionary of modules"""
-    if not is_sklearn_available():
-        return {}
-    
-    modules = {}
-    
-    # Core modules
-    try:
-        import sklearn.base
-        modules['base'] = sklearn.base
-    except ImportError:
-        pass
-    
-    # Pipeline
-    try:
-        import sklearn.pipeline
-        modules['pipeline'] = sklearn.pipeline
-    except ImportError:
-        pass
-    
-    # Preprocessing
-    try:
-        import sklearn.preprocessing
-        modules['preprocessing'] = sklearn.preprocessing
-    except ImportError:
-        pass
-    
+# Submodules inspected for types, by name under sklearn
+SKLEARN_SUBMODULES = (
+    'base',
+    'pipeline',
+    'preprocessing',
     # Models
-    try:
-        import sklearn.linear_model
-        modules['linear_model'] = sklearn.linear_model
-    except ImportError:
-        pass
-    
-    try:
-        import sklearn.ensemble
-        modules['ensemble'] = sklearn.ensemble
-    except ImportError:
-        pass
+    'linear_model',
+    'ensemble',
+    'cluster',
+    'model_selection',
+    'metrics',
+)
+
+# Module prefix of members defined inside scikit-learn. Matching on the dot
+# also rules out other packages whose names merely start with "sklearn"
+_SKLEARN_PREFIX = 'sklearn.'
+
+class LazyModule:
+    """Proxy for a module that is only imported on first attribute access"""
     
-    try:
-        import sklearn.cluster
-        modules['cluster'] = sklearn.cluster
-    except ImportError:
-        pass
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
     
-    # Model selection
-    try:
-        import sklearn.model_selection
-        modules['model_selection'] = sklearn.model_selection
-    except ImportError:
-        pass
+    def load(self) -> Any:
+        """Import the module if it hasn't been yet and return it"""
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
     
-    # Metrics
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self.load(), attr)
+
+def _load_module(module: Any) -> Optional[Any]:
+    """Resolve a possibly lazy module, returning None if it can't be imported"""
+    if not isinstance(module, LazyModule):
+        return module
     try:
-        import sklearn.metrics
-        modules['metrics'] = sklearn.metrics
+        return module.load()
     except ImportError:
-        pass
+        return None
+
+# Modules returned by import_sklearn_modules, built on the first call
+_MODULES_CACHE = None
+
+def import_sklearn_modules() -> Dict[str, Any]:
+    """
+    Return a dictionary of scikit-learn modules.
+    
+    Modules are LazyModule proxies, imported only once their members are
+    inspected.
+    """
+    global _MODULES_CACHE
+    if _MODULES_CACHE is not None:
+        return _MODULES_CACHE
+    if not is_sklearn_available():
+        return {}
     
-    return modules
+    _MODULES_CACHE = {name: LazyModule(f"sklearn.{name}") for name in SKLEARN_SUBMODULES}
+    return _MODULES_CACHE
 
-def get_sklearn_classes(modules: Dict[str, Any]) -> Dict[str, Any]:
-    """Extract classes from scikit-learn modules"""
+def get_sklearn_members(modules: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Extract classes and functions from scikit-learn modules.
+    
+    Each module's namespace is walked once, in definition order.
+    
+    Returns:
+        A (classes, functions) tuple of dictionaries keyed by full name
+    """
     classes = {}
+    functions = {}
     
     for module_name, module in modules.items():
-        for name, obj in inspect.getmembers(module):
-            # Skip private members and non-classes
-            if name.startswith('_') or not inspect.isclass(obj):
+        module = _load_module(module)
+        if module is None:
+            continue
+        for name, obj in vars(module).items():
+            # Skip private members and anything but classes and functions
+            if name.startswith('_'):
+                continue
+            if inspect.isclass(obj):
+                members = classes
+            elif inspect.isfunction(obj):
+                members = functions
+            else:
                 continue
             
-            # Skip classes not defined in scikit-learn
-            if not obj.__module__.startswith('sklearn'):
+            # Skip members not defined in scikit-learn
+            obj_module = obj.__module__
+            if not (obj_module == 'sklearn' or obj_module.startswith(_SKLEARN_PREFIX)):
                 continue
             
-            # Add class to dictionary
-            full_name = f"sklearn.{module_name}.{name}"
-            classes[full_name] = obj
+            # Add member to dictionary
+            members[f"sklearn.{module_name}.{name}"] = obj
     
-    return classes
+    return classes, functions
+
+def get_sklearn_classes(modules: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract classes from scikit-learn modules"""
+    return get_sklearn_members(modules)[0]
 
 def get_sklearn_functions(modules: Dict[str, Any]) -> Dict[str, Any]:
     """Extract functions from scikit-learn modules"""
-    functions = {}
-    
-    for module_name, module in modules.items():
-        for name, obj in inspect.getmembers(module):
-            # Skip private members and non-functions
-            if name.startswith('_') or not inspect.isfunction(obj):
-                continue
-            
-            # Skip functions not defined in scikit-learn
-            if not obj.__module__.startswith('sklearn'):
-                continue
-            
-            # Add function to dictionary
-            full_name = f"sklearn.{module_name}.{name}"
-            functions[full_name] = obj
-    
-    return functions
+    return get_sklearn_members(modules)[1]
 
+@lru_cache(maxsize=1)
 def extract_sklearn_types() -> Dict[str, Any]:
     """Extract scikit-learn types for TypeScript generation"""
-    if not is_sklearn_available():
+    # Checked here as well as in main, for callers that skip main
+    if not INCLUDE_SCIKIT_LEARN or not is_sklearn_available():
         return {}
     
     # Import scikit-learn modules
     modules = import_sklearn_modules()
     
     # Extract classes and functions
-    classes = get_sklearn_classes(modules)
-    functions = get_sklearn_functions(modules)
+    classes, functions = get_sklearn_members(modules)
     
     # Combine classes and functions
     types = {**classes, **functions}
@@ -144,7 +154,7 @@ def extract_sklearn_types() -> Dict[str, Any]:
 
 def integrate_with_featuretools(types: Dict[str, Any]) -> Dict[str, Any]:
     """Integrate scikit-learn types with Featuretools"""
-    if not is_sklearn_available():
+    if not INCLUDE_SCIKIT_LEARN or not is_sklearn_available():
         return types
     
     # Add integration types
@@ -179,7 +189,7 @@ def integrate_with_featuretools(types: Dict[str, Any]) -> Dict[str, Any]:
 def main() -> Dict[str, Any]:
     """Main function to extract scikit-learn types"""
     # Check if scikit-learn support is enabled
-    if os.environ.get('INCLUDE_SCIKIT_LEARN') != 'true':
+    if not INCLUDE_SCIKIT_LEARN:
         return {}
     
     # Check if scikit-learn is available
@@ -187,8 +197,8 @@ def main() -> Dict[str, Any]:
         print("Warning: scikit-learn is not installed. Skipping scikit-learn type extraction.", file=sys.stderr)
         return {}
     
-    # Extract scikit-learn types
-    types = extract_sklearn_types()
+    # Extract scikit-learn types, copied since the extracted types are cached
+    types = dict(extract_sklearn_types())
     
     # Integrate with Featuretools
     types = integrate_with_featuretools(types)
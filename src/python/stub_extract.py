@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# stub_extract.py
+#
+# Extraction of TypeScript types from the AST of .pyi stub files.
+#
+# The module is pure AST and string manipulation with no state shared with
+# generate_types.py beyond the annotation cache, and is fully annotated so
+# it can be compiled with mypyc (`mypyc stub_extract.py` in this directory).
+# A compiled extension module takes precedence over this source file on
+# import, so nothing else has to change to pick it up.
+
+import ast
+import sys
+from typing import Any, Callable, Dict, List, Optional, Union
+
+# Builtin and typing names as they appear in stub annotations, mapped to
+# their TypeScript types (mirrors TYPE_MAPPING in generate_types.py)
+TYPE_NAMES: Dict[str, str] = {
+    'str': 'string',
+    'int': 'number',
+    'float': 'number',
+    'bool': 'boolean',
+    'list': 'any[]',
+    'dict': 'Record<string, any>',
+    'Any': 'any',
+    'None': 'null',
+}
+
+def extract_class_from_stub(node: ast.ClassDef) -> Dict[str, Any]:
+    """Extract class information from an AST ClassDef node"""
+    methods: Dict[str, Dict[str, Any]] = {}
+    properties: Dict[str, Dict[str, Any]] = {}
+    class_info: Dict[str, Any] = {
+        'type': 'class',
+        'name': node.name,
+        'methods': methods,
+        'properties': properties,
+        'doc': ast.get_docstring(node) or ""
+    }
+
+    # Extract methods and properties
+    for item in node.body:
+        if isinstance(item, ast.FunctionDef):
+            # Skip dunder methods except __init__
+            if item.name.startswith('__') and item.name != '__init__':
+                continue
+
+            methods[item.name] = extract_function_from_stub(item)
+        elif isinstance(item, ast.AnnAssign):
+            # This is a property with a type annotation
+            if isinstance(item.target, ast.Name):
+                prop_name = item.target.id
+                prop_type = extract_annotation_from_stub(item.annotation)
+                properties[prop_name] = {
+                    'type': prop_type,
+                    'optional': False  # Assume required unless marked optional
+                }
+
+    return class_info
+
+def extract_function_from_stub(node: ast.FunctionDef) -> Dict[str, Any]:
+    """Extract function information from an AST FunctionDef node"""
+    params: List[Dict[str, Any]] = []
+    func_info: Dict[str, Any] = {
+        'type': 'function',
+        'name': node.name,
+        'params': params,
+        'return_type': 'any',
+        'doc': ast.get_docstring(node) or ""
+    }
+
+    # Extract return type
+    if node.returns:
+        func_info['return_type'] = extract_annotation_from_stub(node.returns)
+
+    # Extract parameters
+    for param in node.args.args:
+        # Skip 'self' parameter
+        if param.arg == 'self':
+            continue
+
+        param_info: Dict[str, Any] = {
+            'name': param.arg,
+            'type': 'any',
+            'optional': False
+        }
+
+        # Extract parameter type
+        if param.annotation:
+            param_info['type'] = extract_annotation_from_stub(param.annotation)
+
+        params.append(param_info)
+
+    # Handle default values (optional parameters)
+    defaults_offset = len(node.args.args) - len(node.args.defaults)
+    for i in range(len(node.args.defaults)):
+        param_index = i + defaults_offset
+        if param_index < len(params):
+            params[param_index]['optional'] = True
+
+    return func_info
+
+# Subscript slices - Python 3.6-3.8 wrap them in ast.Index, 3.9+ don't. The
+# unwrapping is picked once here rather than on every subscript
+if sys.version_info < (3, 9):
+    def _get_slice_elts(slice_node: ast.AST) -> Optional[List[ast.expr]]:
+        """Return a subscript's elements, or None for slices other than an Index"""
+        if not isinstance(slice_node, ast.Index):
+            return None
+        slice_value = slice_node.value
+        if isinstance(slice_value, ast.Tuple):
+            return slice_value.elts
+        return [slice_value]
+else:
+    def _get_slice_elts(slice_node: ast.AST) -> Optional[List[ast.expr]]:
+        """Return a subscript's elements"""
+        if isinstance(slice_node, ast.Tuple):
+            return slice_node.elts
+        return [slice_node]  # type: ignore[list-item]
+
+def _annotation_list(slice_elts: List[ast.expr]) -> str:
+    if len(slice_elts) > 0:
+        value_type = extract_annotation_from_stub(slice_elts[0])
+        return f"{value_type}[]"
+    return "any[]"
+
+def _annotation_dict(slice_elts: List[ast.expr]) -> str:
+    if len(slice_elts) >= 2:
+        key_type = extract_annotation_from_stub(slice_elts[0])
+        value_type = extract_annotation_from_stub(slice_elts[1])
+
+        if key_type == 'str' or key_type == 'string':
+            return f"Record<string, {value_type}>"
+        else:
+            return f"Record<{key_type}, {value_type}>"
+    return "Record<string, any>"
+
+def _annotation_optional(slice_elts: List[ast.expr]) -> str:
+    if len(slice_elts) > 0:
+        inner_type = extract_annotation_from_stub(slice_elts[0])
+        return f"{inner_type} | null"
+    return "any | null"
+
+def _annotation_union(slice_elts: List[ast.expr]) -> str:
+    types = [extract_annotation_from_stub(elt) for elt in slice_elts]
+
+    # Check if it's an Optional (Union with None)
+    if 'None' in types or 'null' in types:
+        non_none_types = [t for t in types if t != 'None' and t != 'null']
+        if len(non_none_types) == 1:
+            return f"{non_none_types[0]} | null"
+        else:
+            return f"({' | '.join(non_none_types)}) | null"
+    else:
+        return ' | '.join(types)
+
+# TypeScript spellings of the Python literals that differ. Lookups must be
+# guarded by an identity/bool check since 1 == True and 0 == False
+_LITERAL_KEYWORDS: Dict[Optional[bool], str] = {True: 'true', False: 'false', None: 'null'}
+
+def format_literal(value: Union[str, int, float, bool, None]) -> str:
+    """Format a str, number, bool or None literal value for TypeScript"""
+    if value is None or isinstance(value, bool):
+        return _LITERAL_KEYWORDS[value]
+    if isinstance(value, str):
+        return f"'{value}'"
+    return str(value)
+
+# The field holding a literal node's value, by node type
+_LITERAL_VALUE_FIELDS: Dict[type, str] = {ast.Constant: 'value'}
+if sys.version_info < (3, 8):
+    _LITERAL_VALUE_FIELDS.update({ast.Str: 's', ast.Num: 'n', ast.NameConstant: 'value'})
+
+def _annotation_literal(slice_elts: List[ast.expr]) -> str:
+    literals = []
+    for elt in slice_elts:
+        field = _LITERAL_VALUE_FIELDS.get(type(elt))
+        if field is not None:
+            literals.append(format_literal(getattr(elt, field)))
+    return ' | '.join(literals) if literals else 'any'
+
+# Generic container names mapped to their subscript handlers
+_CONTAINER_HANDLERS: Dict[str, Callable[[List[ast.expr]], str]] = {
+    'List': _annotation_list,
+    'list': _annotation_list,
+    'Dict': _annotation_dict,
+    'dict': _annotation_dict,
+    'Optional': _annotation_optional,
+    'Union': _annotation_union,
+    'Literal': _annotation_literal,
+}
+
+def _annotation_name(annotation: ast.Name) -> str:
+    # Simple type like 'str', 'int', etc.
+    type_name = annotation.id
+    return TYPE_NAMES.get(type_name, type_name)
+
+def _annotation_subscript(annotation: ast.Subscript) -> str:
+    # Generic type like List[str], Dict[str, int], etc.
+    if not isinstance(annotation.value, ast.Name):
+        return 'any'
+    container_type = annotation.value.id
+
+    slice_elts = _get_slice_elts(annotation.slice)
+    if slice_elts is None:
+        return container_type
+
+    handler = _CONTAINER_HANDLERS.get(container_type)
+    if handler is None:
+        # Other generic types
+        return container_type
+    return handler(slice_elts)
+
+def _annotation_constant(annotation: ast.Constant) -> str:
+    # Literal values (Python 3.8+)
+    if annotation.value is None:
+        return 'null'
+    else:
+        return str(annotation.value)
+
+def _annotation_attribute(annotation: ast.Attribute) -> str:
+    # Qualified names like module.Type
+    return annotation.attr
+
+# Annotation handlers keyed by AST node type, so dispatch is a single lookup
+_ANNOTATION_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    ast.Name: _annotation_name,
+    ast.Subscript: _annotation_subscript,
+    ast.Constant: _annotation_constant,
+    ast.Attribute: _annotation_attribute,
+}
+if sys.version_info < (3, 8):
+    def _annotation_name_constant(annotation: ast.NameConstant) -> str:
+        if annotation.value is None:
+            return 'null'
+        return str(annotation.value).lower()
+
+    # Literal node types replaced by ast.Constant in Python 3.8
+    _ANNOTATION_HANDLERS.update({
+        ast.Str: lambda annotation: f"'{annotation.s}'",
+        ast.Num: lambda annotation: str(annotation.n),
+        ast.NameConstant: _annotation_name_constant,
+        ast.Ellipsis: lambda annotation: 'any',
+    })
+
+# Extracted annotations keyed by their ast.dump() form, shared across stub
+# files since the same annotations (str, Optional[str], Dict[str, Any], ...)
+# recur throughout them
+ANNOTATION_CACHE: Dict[str, str] = {}
+ANNOTATION_CACHE_SIZE = 4096
+
+def extract_annotation_from_stub(annotation: ast.AST) -> str:
+    """Extract type annotation from an AST node with Python version compatibility"""
+    key = ast.dump(annotation, annotate_fields=False)
+    result = ANNOTATION_CACHE.get(key)
+    if result is not None:
+        return result
+
+    handler = _ANNOTATION_HANDLERS.get(type(annotation))
+    # Default to 'any' for complex or unsupported annotations
+    result = handler(annotation) if handler is not None else 'any'
+
+    if len(ANNOTATION_CACHE) >= ANNOTATION_CACHE_SIZE:
+        # Evict the oldest entry
+        del ANNOTATION_CACHE[next(iter(ANNOTATION_CACHE))]
+    ANNOTATION_CACHE[key] = result
+    return result
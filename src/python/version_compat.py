@@ -8,7 +8,9 @@
 # changes to ensure consistent behavior across Python versions.
 
 import sys
+import types
 import typing
+from collections import namedtuple
 from functools import lru_cache
 
 # Get Python version info for compatibility checks
@@ -19,23 +21,55 @@ PY38 = PY_VERSION[:2] == (3, 8)
 PY39 = PY_VERSION[:2] == (3, 9)
 PY310_PLUS = PY_VERSION[:2] >= (3, 10)
 
+class _VersionInfo(namedtuple('VersionInfo', 'major minor micro py36 py37 py38 py39 py310_plus')):
+    """Immutable Python version info, read by attribute or by field name"""
+    __slots__ = ()
+    
+    def __getitem__(self, key):
+        # Field names are still accepted, as when VERSION_INFO was a dict
+        if isinstance(key, str):
+            return getattr(self, key)
+        return super().__getitem__(key)
+
 # Export the current Python version for other modules to use
-VERSION_INFO = {
-    'major': PY_VERSION.major,
-    'minor': PY_VERSION.minor,
-    'micro': PY_VERSION.micro,
-    'py36': PY36,
-    'py37': PY37,
-    'py38': PY38,
-    'py39': PY39,
-    'py310_plus': PY310_PLUS
-}
+VERSION_INFO = _VersionInfo(
+    PY_VERSION.major, PY_VERSION.minor, PY_VERSION.micro,
+    PY36, PY37, PY38, PY39, PY310_PLUS
+)
 
 # -----------------------------------------------------------------------------
 # Handle get_type_hints compatibility issues
 # -----------------------------------------------------------------------------
 
+# The version-specific implementations below are bound once at import rather
+# than branching on the Python version on every call
+
+if PY39 or PY310_PLUS:
+    # Python 3.9+ supports include_extras parameter
+    _get_type_hints = typing.get_type_hints
+else:
+    def _get_type_hints(obj, globalns, localns, include_extras):
+        # Earlier versions don't support include_extras
+        return typing.get_type_hints(obj, globalns, localns)
+
+def _get_type_hints_uncached(obj, globalns, localns, include_extras):
+    try:
+        return _get_type_hints(obj, globalns, localns, include_extras)
+    except (TypeError, ValueError, AttributeError):
+        # Handle cases where get_type_hints fails
+        return getattr(obj, '__annotations__', {})
+
+# Namespaces are usually dicts and so unhashable - only calls without them
+# are cached, keyed by the object alone. Calls almost always leave
+# include_extras off, so that gets its own cache
+@lru_cache(maxsize=2048)
+def _get_type_hints_no_extras(obj):
+    return _get_type_hints_uncached(obj, None, None, False)
+
 @lru_cache(maxsize=128)
+def _get_type_hints_extras(obj):
+    return _get_type_hints_uncached(obj, None, None, True)
+
 def get_type_hints_compat(obj, globalns=None, localns=None, include_extras=False):
     """
     Compatible version of get_type_hints that works across Python versions.
@@ -49,16 +83,15 @@ def get_type_hints_compat(obj, globalns=None, localns=None, include_extras=False
     Returns:
         Dict of parameter names to their type annotations
     """
-    try:
-        if PY39 or PY310_PLUS:
-            # Python 3.9+ supports include_extras parameter
-            return typing.get_type_hints(obj, globalns, localns, include_extras)
-        else:
-            # Earlier versions don't support include_extras
-            return typing.get_type_hints(obj, globalns, localns)
-    except (TypeError, ValueError, AttributeError):
-        # Handle cases where get_type_hints fails
-        return getattr(obj, '__annotations__', {})
+    if globalns is None and localns is None:
+        try:
+            if include_extras:
+                return _get_type_hints_extras(obj)
+            return _get_type_hints_no_extras(obj)
+        except TypeError:
+            # Unhashable object
+            pass
+    return _get_type_hints_uncached(obj, globalns, localns, include_extras)
 
 # -----------------------------------------------------------------------------
 # Handle Protocol compatibility issues
@@ -87,21 +120,32 @@ def get_protocol():
 
 Protocol = get_protocol()
 
-@lru_cache(maxsize=128)
-def is_protocol(cls):
-    """
-    Check if a class is a Protocol across different Python versions.
-    
-    Args:
-        cls: The class to check
-    
-    Returns:
-        bool: True if the class is a Protocol, False otherwise
-    """
-    if PY38 or PY39 or PY310_PLUS:
-        # Python 3.8+ can check _is_protocol directly
+if PY38 or PY39 or PY310_PLUS:
+    def is_protocol(cls):
+        """
+        Check if a class is a Protocol across different Python versions.
+        
+        Args:
+            cls: The class to check
+        
+        Returns:
+            bool: True if the class is a Protocol, False otherwise
+        """
+        # Python 3.8+ can check _is_protocol directly, which is cheaper than
+        # a cache lookup
         return getattr(cls, '_is_protocol', False)
-    else:
+else:
+    @lru_cache(maxsize=128)
+    def is_protocol(cls):
+        """
+        Check if a class is a Protocol across different Python versions.
+        
+        Args:
+            cls: The class to check
+        
+        Returns:
+            bool: True if the class is a Protocol, False otherwise
+        """
         # Older versions need more complex checks
         try:
             return any(base is Protocol for base in getattr(cls, '__mro__', []))
@@ -112,43 +156,42 @@ def is_protocol(cls):
 # Handle get_origin and get_args compatibility issues
 # -----------------------------------------------------------------------------
 
-@lru_cache(maxsize=128)
-def get_origin_compat(tp):
-    """
-    Compatible version of get_origin that works across Python versions.
-    
-    Args:
-        tp: The type to get the origin of
-    
-    Returns:
-        The origin of the type, or None if not applicable
-    """
-    if PY36 or PY37:
+if PY36 or PY37:
+    @lru_cache(maxsize=128)
+    def get_origin_compat(tp):
+        """
+        Compatible version of get_origin that works across Python versions.
+        
+        Args:
+            tp: The type to get the origin of
+        
+        Returns:
+            The origin of the type, or None if not applicable
+        """
         # Python 3.6 and 3.7 don't have get_origin, so we handle common cases
         if hasattr(tp, '__origin__'):
             return tp.__origin__
         return None
-    # Python 3.8+ has get_origin
-    return typing.get_origin(tp)
-
-@lru_cache(maxsize=128)
-def get_args_compat(tp):
-    """
-    Compatible version of get_args that works across Python versions.
-    
-    Args:
-        tp: The type to get the arguments of
     
-    Returns:
-        Tuple of the type arguments, or an empty tuple if not applicable
-    """
-    if PY36 or PY37:
+    @lru_cache(maxsize=128)
+    def get_args_compat(tp):
+        """
+        Compatible version of get_args that works across Python versions.
+        
+        Args:
+            tp: The type to get the arguments of
+        
+        Returns:
+            Tuple of the type arguments, or an empty tuple if not applicable
+        """
         # Python 3.6 and 3.7 don't have get_args, so we handle common cases
         if hasattr(tp, '__args__'):
             return tp.__args__
         return ()
-    # Python 3.8+ has get_args
-    return typing.get_args(tp)
+else:
+    # Python 3.8+ has get_origin and get_args
+    get_origin_compat = typing.get_origin
+    get_args_compat = typing.get_args
 
 # -----------------------------------------------------------------------------
 # Handle TypedDict compatibility issues
@@ -181,12 +224,12 @@ def is_typed_dict(cls):
     Returns:
         bool: True if the class is a TypedDict, False otherwise
     """
-    if PY38 or PY39 or PY310_PLUS:
-        # Python 3.8+ has a proper TypedDict we can compare against
-        return isinstance(cls, type) and issubclass(cls, TypedDict)
-    else:
-        # For older versions, look for TypedDict specific attributes
-        return hasattr(cls, '__annotations__') and hasattr(cls, '__total__')
+    # TypedDict isn't a class on every version, so it can't be passed to
+    # issubclass(). TypedDict classes are dicts carrying TypedDict attributes
+    return (
+        isinstance(cls, type) and issubclass(cls, dict)
+        and hasattr(cls, '__annotations__') and hasattr(cls, '__total__')
+    )
 
 # -----------------------------------------------------------------------------
 # Handle Literal compatibility issues
@@ -213,6 +256,13 @@ Literal = get_literal()
 # Handle Union and Optional type compatibility issues
 # -----------------------------------------------------------------------------
 
+if PY310_PLUS:
+    # In Python 3.10+, X | Y creates types.UnionType rather than a typing.Union
+    _UNION_ORIGINS = (typing.Union, types.UnionType)
+else:
+    # In earlier versions, Union types have a specific origin
+    _UNION_ORIGINS = (typing.Union,)
+
 @lru_cache(maxsize=128)
 def is_union_type(tp):
     """
@@ -224,13 +274,7 @@ def is_union_type(tp):
     Returns:
         bool: True if the type is a Union, False otherwise
     """
-    if PY310_PLUS:
-        # In Python 3.10+, Union types are represented using the | operator
-        # which creates types with a special __or__ method
-        return get_origin_compat(tp) is typing.Union or hasattr(tp, '__or__')
-    else:
-        # In earlier versions, Union types have a specific origin
-        return get_origin_compat(tp) is typing.Union
+    return get_origin_compat(tp) in _UNION_ORIGINS
 
 @lru_cache(maxsize=128)
 def is_optional_type(tp):